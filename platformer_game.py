@@ -6,9 +6,8 @@ A simple side-scrolling platformer game controlled by hand gestures.
 
 import math
 import os
-import random
 import sys
-import time
+import threading
 
 import cv2
 import numpy as np
@@ -20,6 +19,78 @@ sys.path.insert(0, os.path.join(script_dir, "src"))
 
 from simple_detection import SimpleHandDetector
 
+# Quadrant lookup for hand orientation, indexed by the pointing angle
+# rotated 45 degrees and bucketed into 90-degree sectors
+_DIRECTIONS = ("right", "down", "left", "up")
+
+
+class VisionThread:
+    """Camera capture and hand detection running on a background thread.
+
+    The game loop used to block on cap.read() plus the full detection
+    pipeline every frame, capping the render rate at the camera rate.
+    This thread runs both at its own pace and publishes the most recent
+    (hand_center, contour, gesture, processed_frame) tuple; the game loop
+    picks it up without waiting.
+    """
+
+    def __init__(self, cap, detector):
+        self.cap = cap
+        self.detector = detector
+        self.failed = False
+        self._lock = threading.Lock()
+        self._result = None
+        self._flip_buf = None
+        # Run the detector on every Nth camera frame; gesture input does
+        # not need the full camera rate and this halves the vision CPU cost
+        self.detect_every = 2
+        self._frame_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._vision_loop, daemon=True)
+        self._thread.start()
+
+    def _vision_loop(self):
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                # Camera gone - flag it so the game loop can shut down
+                self.failed = True
+                return
+
+            # Skip detection on the in-between frames. The frame is still
+            # read so the driver buffer stays fresh; the game simply keeps
+            # acting on the last published result.
+            self._frame_count += 1
+            if self._frame_count % self.detect_every:
+                continue
+
+            # Flip horizontally for more intuitive controls, reusing one
+            # buffer instead of allocating a full frame per iteration.
+            # The detector copies the frame for its visualization, so the
+            # buffer is free again by the next read.
+            if self._flip_buf is None or self._flip_buf.shape != frame.shape:
+                self._flip_buf = np.empty_like(frame)
+            cv2.flip(frame, 1, dst=self._flip_buf)
+            frame = self._flip_buf
+
+            hand_center, contour, processed_frame = self.detector.process_frame(
+                frame, face_mask=None
+            )
+            gesture = self.detector.get_gesture() if hand_center else "unknown"
+
+            with self._lock:
+                self._result = (hand_center, contour, gesture, processed_frame)
+
+    def result(self):
+        """Return the most recent detection result, or None if none yet."""
+        with self._lock:
+            return self._result
+
+    def stop(self):
+        """Stop the capture loop and wait for the thread to exit."""
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
 
 class PlatformerGame:
     """A simple 2D platformer game controlled by hand gestures."""
@@ -29,14 +100,28 @@ class PlatformerGame:
         # Initialize pygame
         pygame.init()
 
-        # Game window settings
+        # OpenCV's thread fan-out costs more than it saves on the small
+        # frames we process and competes with the game loop for cores
+        cv2.setNumThreads(1)
+
+        # Game window settings. Vsync pacing is requested when the driver
+        # supports it, which removes tearing and the worst of the OS sleep
+        # jitter from clock.tick; it is only a request, so fall back to a
+        # plain window otherwise.
         self.width, self.height = 800, 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        try:
+            self.screen = pygame.display.set_mode(
+                (self.width, self.height), vsync=1
+            )
+        except pygame.error:
+            self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Hand Gesture Platformer")
 
-        # Clock for controlling frame rate
+        # Clock for controlling frame rate. The tick() return value gives
+        # the frame delta without an extra time.time() syscall per frame.
         self.clock = pygame.time.Clock()
         self.fps = 60
+        self.delta_time = 1.0 / self.fps
 
         # Game state
         self.running = True
@@ -54,6 +139,19 @@ class PlatformerGame:
         self.RED = (255, 0, 0)
         self.GOLD = (255, 215, 0)
 
+        # Static sky gradient, built once with NumPy instead of per-row draws
+        self._bg_surf = self._create_gradient_background(
+            (95, 165, 220), self.SKY_BLUE
+        )
+
+        # Semi-transparent game-over overlay, built once and converted to
+        # the display format so the per-frame blit stays cheap
+        self._gameover_overlay = pygame.Surface(
+            (self.width, self.height), pygame.SRCALPHA
+        )
+        self._gameover_overlay.fill((0, 0, 0, 180))
+        self._gameover_overlay = self._gameover_overlay.convert_alpha()
+
         # Player character
         self.player = {
             "x": 100,
@@ -104,8 +202,14 @@ class PlatformerGame:
             },
         ]
 
-        # Collectibles - coins, power-ups, etc.
-        self.collectibles = []
+        # One generator for all spawn randomness, so level generation draws
+        # whole batches of samples in single calls
+        self._rng = np.random.default_rng()
+
+        # Collectibles - coins, kept as parallel NumPy arrays so the
+        # per-frame collision test is one vectorized AABB expression
+        self.collectible_size = 20
+        self.collectible_value = 10
         self._generate_collectibles(20)  # Generate 20 collectibles
 
         # Game world properties
@@ -129,7 +233,23 @@ class PlatformerGame:
             self.camera_index = 0
             self.cap = cv2.VideoCapture(self.camera_index)
 
+        # Request a modest capture mode up front: the detector gains nothing
+        # from larger frames, 30 fps matches the detection cadence, and a
+        # single-frame driver buffer keeps detection on the newest frame
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: camera driver ignored the buffer size request")
+
         self.hand_detector = SimpleHandDetector()
+        self.vision = VisionThread(self.cap, self.hand_detector)
+        self._last_result = None
+        self._processed_frame = None
+
+        # The OpenCV preview window costs a HighGUI event-loop pump plus a
+        # frame copy every game frame, so it is opt-in for debugging only
+        self._debug_cv = bool(os.environ.get("HANDGAME_DEBUG_CV"))
 
         # Gesture controls
         self.last_gesture = "unknown"
@@ -140,43 +260,97 @@ class PlatformerGame:
         self.clouds = []
         self._generate_clouds(10)
 
-        # Font for text display
+        # Fonts for text display
         self.font = pygame.font.SysFont("Arial", 24)
+        self.game_over_font = pygame.font.SysFont("Arial", 64)
+
+        # Rendered-text cache so unchanged strings are rasterized once
+        self.text_cache = {}
+
+        # Static game-over text never changes, so render it and compute the
+        # centered positions once instead of on every game-over frame
+        game_over_text = self.render_text(self.game_over_font, "GAME OVER", self.WHITE)
+        restart_text = self.render_text(
+            self.font, "Press SPACE to restart", self.WHITE
+        )
+        self._gameover_items = [
+            (
+                game_over_text,
+                (
+                    self.width // 2 - game_over_text.get_width() // 2,
+                    self.height // 2 - 50,
+                ),
+            ),
+            (
+                restart_text,
+                (
+                    self.width // 2 - restart_text.get_width() // 2,
+                    self.height // 2 + 60,
+                ),
+            ),
+        ]
 
         # Sound effects
         self._load_sounds()
 
+    def render_text(self, font, text, color):
+        """Render text through a cache keyed by font, string and color.
+
+        Font rasterization goes through FreeType and allocates a new
+        surface on every call; score and gesture strings repeat for many
+        frames in a row, so cache hits skip all of that.
+        """
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+        return surface
+
+    def _create_gradient_background(self, top_color, bottom_color):
+        """Build a vertical gradient surface with vectorized NumPy.
+
+        Interpolating row colors with broadcast arithmetic and blitting the
+        whole array at once replaces hundreds of per-row draw calls.
+        """
+        ratio = np.linspace(0.0, 1.0, self.height, dtype=np.float32)[:, None]
+        top = np.array(top_color, dtype=np.float32)
+        bottom = np.array(bottom_color, dtype=np.float32)
+        rows = (top * (1.0 - ratio) + bottom * ratio).astype(np.uint8)
+        gradient = np.broadcast_to(rows[None, :, :], (self.width, self.height, 3))
+
+        surface = pygame.Surface((self.width, self.height))
+        pygame.surfarray.blit_array(surface, gradient)
+        return surface.convert()
+
     def _generate_collectibles(self, count):
         """Generate collectibles throughout the level."""
-        self.collectibles = []
-        for _ in range(count):
-            x = random.randint(100, self.width * 2)  # Spread across the level
-            y = random.randint(100, self.ground_level - 150)  # Above ground level
-            self.collectibles.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "width": 20,
-                    "height": 20,
-                    "collected": False,
-                    "type": "coin",  # Default type
-                    "color": self.GOLD,
-                    "value": 10,
-                }
-            )
+        # Spread across the level, above ground level, drawn as one batch
+        self._col_x = self._rng.integers(
+            100, self.width * 2, size=count, endpoint=True
+        ).astype(np.float32)
+        self._col_y = self._rng.integers(
+            100, self.ground_level - 150, size=count, endpoint=True
+        ).astype(np.float32)
+        self._col_collected = np.zeros(count, dtype=bool)
 
     def _generate_clouds(self, count):
         """Generate decorative clouds in the background."""
-        self.clouds = []
-        for _ in range(count):
-            x = random.randint(0, self.width * 3)
-            y = random.randint(50, 200)
-            width = random.randint(60, 120)
-            height = random.randint(30, 50)
-            speed = random.uniform(0.2, 0.5)
-            self.clouds.append(
-                {"x": x, "y": y, "width": width, "height": height, "speed": speed}
-            )
+        xs = self._rng.integers(0, self.width * 3, size=count, endpoint=True)
+        ys = self._rng.integers(50, 200, size=count, endpoint=True)
+        widths = self._rng.integers(60, 120, size=count, endpoint=True)
+        heights = self._rng.integers(30, 50, size=count, endpoint=True)
+        speeds = self._rng.uniform(0.2, 0.5, size=count)
+        self.clouds = [
+            {
+                "x": float(x),
+                "y": int(y),
+                "width": int(w),
+                "height": int(h),
+                "speed": float(s),
+            }
+            for x, y, w, h, s in zip(xs, ys, widths, heights, speeds)
+        ]
 
     def _load_sounds(self):
         """Load game sound effects."""
@@ -201,28 +375,46 @@ class PlatformerGame:
             )
 
     def detect_hand(self):
-        """Process camera input to detect hand and control the game."""
-        ret, frame = self.cap.read()
-        if not ret:
+        """Apply the latest hand detection result to control the game.
+
+        Capture and detection run on the vision thread; this only picks up
+        its most recent result, so the game loop never blocks on the camera.
+        """
+        if self.vision.failed:
             return False
 
-        # Flip horizontally for more intuitive controls
-        frame = cv2.flip(frame, 1)
+        # Only react to results we have not seen yet
+        result = self.vision.result()
+        if result is not None and result is not self._last_result:
+            self._last_result = result
+            self._apply_hand_result(*result)
 
-        # Process the frame to get hand position and gesture - explicitly pass None for face_mask to disable face detection
-        hand_center, contour, processed_frame = self.hand_detector.process_frame(
-            frame, face_mask=None
-        )
+        # Display the processed frame with hand detection (debug only)
+        if self._debug_cv and self._processed_frame is not None:
+            cv2.imshow("Hand Detection", self._processed_frame)
 
-        if hand_center and contour is not None:
-            # Get the gesture
-            gesture = self.hand_detector.get_gesture()
+            # Check for 'q' key to quit
+            key = cv2.waitKey(1)
+            if key & 0xFF == ord("q"):
+                return False
 
+        # Update jump cooldown
+        if self.jump_cooldown > 0:
+            self.jump_cooldown -= 1
+
+        return True
+
+    def _apply_hand_result(self, hand_center, contour, gesture, processed_frame):
+        """Translate one detection result into player controls."""
+        self._processed_frame = processed_frame
+
+        if hand_center and contour is not None:
             # Get hand orientation for directional control
             orientation = self._detect_hand_orientation(contour, hand_center)
 
-            # Draw orientation indicator on processed frame
-            if orientation:
+            # Draw orientation indicator on processed frame (only decorates
+            # the debug preview window, so skip it when that is hidden)
+            if orientation and self._debug_cv:
                 direction, angle = orientation
                 end_x = hand_center[0] + int(50 * math.cos(angle))
                 end_y = hand_center[1] + int(50 * math.sin(angle))
@@ -265,20 +457,6 @@ class PlatformerGame:
 
             self.last_gesture = gesture
 
-        # Display the processed frame with hand detection
-        cv2.imshow("Hand Detection", processed_frame)
-
-        # Check for 'q' key to quit
-        key = cv2.waitKey(1)
-        if key & 0xFF == ord("q"):
-            return False
-
-        # Update jump cooldown
-        if self.jump_cooldown > 0:
-            self.jump_cooldown -= 1
-
-        return True
-
     def _detect_hand_orientation(self, contour, hand_center):
         """Detect the orientation of the hand based on its contour.
 
@@ -351,16 +529,11 @@ class PlatformerGame:
             # Calculate angle
             angle = math.atan2(dy, dx)
 
-            # Determine direction based on angle
-            # Divide the circle into 4 quadrants
-            if -math.pi / 4 <= angle <= math.pi / 4:
-                direction = "right"
-            elif math.pi / 4 < angle <= 3 * math.pi / 4:
-                direction = "down"
-            elif -3 * math.pi / 4 <= angle < -math.pi / 4:
-                direction = "up"
-            else:  # angle > 3*math.pi/4 or angle < -3*math.pi/4
-                direction = "left"
+            # Determine direction by bucketing the angle into quadrants:
+            # rotating by 45 degrees aligns sector boundaries to multiples
+            # of 90, so the chained comparisons become one table lookup
+            idx = int((math.degrees(angle) + 45.0) % 360.0 // 90.0)
+            direction = _DIRECTIONS[idx]
 
             return (direction, angle)
 
@@ -423,8 +596,11 @@ class PlatformerGame:
 
     def _update_clouds(self):
         """Update cloud positions for parallax scrolling effect."""
+        # Cloud speeds are tuned in pixels per frame at the target fps;
+        # scale by the measured delta so parallax stays smooth under load
+        frames = self.delta_time * self.fps
         for cloud in self.clouds:
-            cloud["x"] -= cloud["speed"]
+            cloud["x"] -= cloud["speed"] * frames
 
             # Wrap clouds around when they go off screen
             if cloud["x"] + cloud["width"] < -self.world_offset:
@@ -432,66 +608,56 @@ class PlatformerGame:
 
     def _check_collisions(self):
         """Check for collisions with platforms, obstacles, and collectibles."""
-        # Player rect for collision detection
-        player_rect = pygame.Rect(
-            self.player["x"] - self.world_offset,
-            self.player["y"],
-            self.player["width"],
-            self.player["height"],
-        )
+        # The world offset shifts the player and the level geometry by the
+        # same amount, so every test can stay in world coordinates on raw
+        # floats - no per-pair pygame.Rect allocation or colliderect call.
+        px = self.player["x"]
+        py = self.player["y"]
+        pw = self.player["width"]
+        ph = self.player["height"]
+        p_bottom = py + ph
 
         # Platform collisions
         self.player["is_jumping"] = True  # Assume in air until proven on platform
         for platform in self.platforms:
-            platform_rect = pygame.Rect(
-                platform["x"] - self.world_offset,
-                platform["y"],
-                platform["width"],
-                platform["height"],
-            )
-
             # Check if player is on top of platform
             if (
-                player_rect.bottom >= platform_rect.top
-                and player_rect.bottom
-                <= platform_rect.top + 20  # Only detect top collisions
-                and player_rect.right > platform_rect.left
-                and player_rect.left < platform_rect.right
+                p_bottom >= platform["y"]
+                and p_bottom <= platform["y"] + 20  # Only detect top collisions
+                and px + pw > platform["x"]
+                and px < platform["x"] + platform["width"]
                 and self.player["vel_y"] > 0
             ):  # Only when falling
-                self.player["y"] = platform_rect.top - self.player["height"]
+                self.player["y"] = platform["y"] - ph
                 self.player["vel_y"] = 0
                 self.player["is_jumping"] = False
 
         # Obstacle collisions
         for obstacle in self.obstacles:
-            obstacle_rect = pygame.Rect(
-                obstacle["x"] - self.world_offset,
-                obstacle["y"],
-                obstacle["width"],
-                obstacle["height"],
-            )
-
-            if player_rect.colliderect(obstacle_rect):
+            if (
+                px < obstacle["x"] + obstacle["width"]
+                and px + pw > obstacle["x"]
+                and py < obstacle["y"] + obstacle["height"]
+                and p_bottom > obstacle["y"]
+            ):
                 self.game_over = True
                 if "game_over" in self.sounds:
                     self.sounds["game_over"].play()
 
-        # Collectible collisions
-        for collectible in self.collectibles:
-            if not collectible["collected"]:
-                collectible_rect = pygame.Rect(
-                    collectible["x"] - self.world_offset,
-                    collectible["y"],
-                    collectible["width"],
-                    collectible["height"],
-                )
-
-                if player_rect.colliderect(collectible_rect):
-                    collectible["collected"] = True
-                    self.score += collectible["value"]
-                    if "coin" in self.sounds:
-                        self.sounds["coin"].play()
+        # Collectible collisions - one vectorized AABB test over all coins
+        size = self.collectible_size
+        hits = np.nonzero(
+            ~self._col_collected
+            & (px < self._col_x + size)
+            & (px + pw > self._col_x)
+            & (py < self._col_y + size)
+            & (p_bottom > self._col_y)
+        )[0]
+        if hits.size:
+            self._col_collected[hits] = True
+            self.score += self.collectible_value * int(hits.size)
+            if "coin" in self.sounds:
+                self.sounds["coin"].play()
 
     def _update_camera(self):
         """Update the camera position for scrolling."""
@@ -504,8 +670,8 @@ class PlatformerGame:
 
     def draw(self):
         """Draw the game elements."""
-        # Fill background
-        self.screen.fill(self.SKY_BLUE)
+        # Sky gradient background
+        self.screen.blit(self._bg_surf, (0, 0))
 
         # Draw clouds (background)
         for cloud in self.clouds:
@@ -549,19 +715,14 @@ class PlatformerGame:
                     ),
                 )
 
-        # Draw collectibles
-        for collectible in self.collectibles:
-            if not collectible["collected"]:
-                pygame.draw.rect(
-                    self.screen,
-                    collectible["color"],
-                    (
-                        collectible["x"] - self.world_offset,
-                        collectible["y"],
-                        collectible["width"],
-                        collectible["height"],
-                    ),
-                )
+        # Draw collectibles (tolist() yields plain floats, which is both
+        # what draw.rect accepts and cheaper than indexing scalars out)
+        size = self.collectible_size
+        remaining = ~self._col_collected
+        xs = (self._col_x[remaining] - self.world_offset).tolist()
+        ys = self._col_y[remaining].tolist()
+        for x, y in zip(xs, ys):
+            pygame.draw.rect(self.screen, self.GOLD, (x, y, size, size))
 
         # Draw obstacles
         for obstacle in self.obstacles:
@@ -625,15 +786,12 @@ class PlatformerGame:
             2,
         )
 
-        # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
-        self.screen.blit(score_text, (20, 20))
-
-        # Draw gesture info
-        gesture_text = self.font.render(
-            f"Gesture: {self.last_gesture}", True, self.WHITE
+        # Draw score and gesture info in one batched call
+        score_text = self.render_text(self.font, f"Score: {self.score}", self.WHITE)
+        gesture_text = self.render_text(
+            self.font, f"Gesture: {self.last_gesture}", self.WHITE
         )
-        self.screen.blit(gesture_text, (20, 50))
+        self.screen.blits([(score_text, (20, 20)), (gesture_text, (20, 50))])
 
         # Game over screen
         if self.game_over:
@@ -644,34 +802,27 @@ class PlatformerGame:
 
     def _draw_game_over(self):
         """Draw game over screen."""
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._gameover_overlay, (0, 0))
 
-        # Game over text
-        game_over_font = pygame.font.SysFont("Arial", 64)
-        game_over_text = game_over_font.render("GAME OVER", True, self.WHITE)
-        self.screen.blit(
-            game_over_text,
-            (self.width // 2 - game_over_text.get_width() // 2, self.height // 2 - 50),
-        )
+        # Static game over / restart text, pre-rendered at init
+        self.screen.blits(self._gameover_items)
 
         # Score text
-        score_text = self.font.render(f"Final Score: {self.score}", True, self.WHITE)
+        score_text = self.render_text(
+            self.font, f"Final Score: {self.score}", self.WHITE
+        )
         self.screen.blit(
             score_text,
             (self.width // 2 - score_text.get_width() // 2, self.height // 2 + 20),
         )
 
-        # Restart instructions
-        restart_text = self.font.render("Press SPACE to restart", True, self.WHITE)
-        self.screen.blit(
-            restart_text,
-            (self.width // 2 - restart_text.get_width() // 2, self.height // 2 + 60),
-        )
-
     def reset_game(self):
-        """Reset the game state."""
+        """Reset the game state.
+
+        Only gameplay state is reset. The camera, the vision thread and the
+        hand detector deliberately persist so a restart keeps the learned
+        background model instead of paying the multi-second relearn phase.
+        """
         self.game_over = False
         self.score = 0
         self.world_offset = 0
@@ -735,13 +886,14 @@ class PlatformerGame:
                 # Draw everything
                 self.draw()
 
-                # Cap the frame rate
-                self.clock.tick(self.fps)
+                # Cap the frame rate and record the actual frame delta
+                self.delta_time = self.clock.tick(self.fps) * 0.001
 
         except Exception as e:
             print(f"Error in game loop: {e}")
         finally:
             # Clean up
+            self.vision.stop()
             pygame.quit()
             cv2.destroyAllWindows()
             self.cap.release()
@@ -5,17 +5,103 @@ This script lets you choose which game to run and which camera to use.
 """
 
 import os
-import subprocess
 import sys
 
 import cv2
 
+# V4L2 ioctl constants for the fast Linux camera probe
+VIDIOC_QUERYCAP = 0x80685600
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+def _list_v4l2_cameras(max_cameras):
+    """Probe /dev/video* devices directly with a V4L2 ioctl (Linux only).
+
+    This answers "is this a real capture device?" in microseconds instead
+    of the multiple seconds cv2.VideoCapture needs per index.
+
+    Returns:
+        list: Valid camera indices, or None if the probe is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        import ctypes
+        import fcntl
+        import glob
+    except ImportError:
+        return None
+
+    # struct v4l2_capability from linux/videodev2.h
+    class v4l2_capability(ctypes.Structure):
+        _fields_ = [
+            ("driver", ctypes.c_char * 16),
+            ("card", ctypes.c_char * 32),
+            ("bus_info", ctypes.c_char * 32),
+            ("version", ctypes.c_uint32),
+            ("capabilities", ctypes.c_uint32),
+            ("device_caps", ctypes.c_uint32),
+            ("reserved", ctypes.c_uint32 * 3),
+        ]
+
+    devices = glob.glob("/dev/video*")
+    if not devices:
+        return None
 
-def list_available_cameras(max_cameras=5):
-    """List available cameras and return a list of valid indices."""
     available_cameras = []
+    for device in devices:
+        try:
+            index = int(device.replace("/dev/video", ""))
+        except ValueError:
+            continue
+        if index >= max_cameras:
+            continue
+
+        caps = v4l2_capability()
+        try:
+            fd = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            continue
+        try:
+            fcntl.ioctl(fd, VIDIOC_QUERYCAP, caps)
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+
+        # capabilities is the union for the whole physical device, so a
+        # UVC camera's metadata node still advertises VIDEO_CAPTURE
+        # there; device_caps describes this node specifically
+        if caps.capabilities & V4L2_CAP_DEVICE_CAPS:
+            node_caps = caps.device_caps
+        else:
+            node_caps = caps.capabilities
+        if node_caps & V4L2_CAP_VIDEO_CAPTURE:
+            available_cameras.append(index)
+
+    return sorted(available_cameras)
+
 
+def list_available_cameras(max_cameras=5):
+    """List available cameras and return a list of valid indices."""
     print("\nDetecting available cameras...")
+
+    # Fast path: query the kernel directly on Linux instead of opening
+    # each index through OpenCV (which may fall through to FFMPEG).
+    v4l2_cameras = _list_v4l2_cameras(max_cameras)
+    if v4l2_cameras is not None:
+        for i in v4l2_cameras:
+            camera_name = f"Camera {i}"
+            if i == 0:
+                camera_name += " (Usually built-in)"
+            elif i == 1:
+                camera_name += " (Usually external)"
+            print(f"  {i}: {camera_name} - Available")
+        return v4l2_cameras
+
+    available_cameras = []
     for i in range(max_cameras):
         cap = cv2.VideoCapture(i)
         if cap.isOpened():
@@ -64,13 +150,16 @@ def choose_camera():
             print("Please enter a valid number.")
 
 
+GAMES = [
+    {"name": "Platformer Game", "script": "run_platformer_game.py"},
+    {"name": "Simplified Game", "script": "simplified_game.py"},
+    {"name": "Simple Running Game", "script": "simple_running_game.py"},
+]
+
+
 def select_game():
     """Let the user select which game to run."""
-    games = [
-        {"name": "Platformer Game", "script": "run_platformer_game.py"},
-        {"name": "Simplified Game", "script": "simplified_game.py"},
-        {"name": "Simple Running Game", "script": "simple_running_game.py"},
-    ]
+    games = GAMES
 
     print("\nAvailable games:")
     for i, game in enumerate(games):
@@ -92,16 +181,35 @@ def select_game():
 
 def main():
     """Main entry point for game selection and running."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hand Motion Adventure Games")
+    parser.add_argument("--camera", type=int, help="Camera index to use")
+    parser.add_argument("--game", type=int, help="Game number to run (1-3)")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Hand Motion Adventure Games")
     print("=" * 60)
 
-    # Select a game
-    game = select_game()
+    # Select a game (skip the prompt when --game is given)
+    if args.game is not None and 1 <= args.game <= len(GAMES):
+        game = GAMES[args.game - 1]
+    else:
+        game = select_game()
     print(f"\nSelected: {game['name']}")
 
-    # Choose a camera
-    camera_index = choose_camera()
+    # Choose a camera. When --camera or GAME_CAMERA_INDEX is set, skip both
+    # the prompt and the multi-second camera enumeration.
+    if args.camera is not None:
+        camera_index = args.camera
+    elif "GAME_CAMERA_INDEX" in os.environ:
+        try:
+            camera_index = int(os.environ["GAME_CAMERA_INDEX"])
+        except ValueError:
+            camera_index = choose_camera()
+    else:
+        camera_index = choose_camera()
     if camera_index is None:
         return 1
 
@@ -109,9 +217,17 @@ def main():
     os.environ["GAME_CAMERA_INDEX"] = str(camera_index)
 
     # Run the selected game
-    script_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), game["script"]
-    )
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_path = os.path.join(script_dir, game["script"])
+
+    # Pre-compile the game scripts to __pycache__ so the modules they import
+    # skip the parse/compile pass (a no-op when bytecode is fresh).
+    try:
+        import compileall
+
+        compileall.compile_dir(script_dir, maxlevels=0, quiet=1)
+    except Exception:
+        pass
 
     try:
         print(f"\nStarting {game['name']} with camera {camera_index}...")
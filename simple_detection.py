@@ -5,20 +5,30 @@ import numpy as np
 
 
 class SimpleHandDetector:
-    """A simplified hand detector using basic OpenCV functions instead of MediaPipe."""
-
-    def __init__(self):
-        # Parameters for skin detection - wider range for better detection
-        self.lower_skin = np.array(
-            [0, 30, 60], dtype=np.uint8
-        )  # More permissive lower bound
-        self.upper_skin = np.array(
-            [30, 255, 255], dtype=np.uint8
-        )  # Higher upper hue bound
-
-        # Previous hand positions for smoothing
-        self.prev_positions = []
+    """A simplified hand detector using basic OpenCV functions instead of MediaPipe.
+
+    The segmentation pipeline runs on a downscaled copy of the frame
+    (``proc_scale``, default half resolution): every stage from the color
+    conversion through findContours is memory-bandwidth-bound, so a 0.5
+    scale cuts their cost to roughly a quarter. The winning contour is
+    scaled back up before any geometry runs, so centers, gestures and
+    drawing keep full-frame coordinates.
+    """
+
+    def __init__(self, proc_scale=0.5):
+        # Skin-tone box in YCrCb. The BGR->YCrCb conversion is a plain
+        # matrix transform (no per-pixel hue division like HSV) and the
+        # Cr/Cb channels separate skin well with a simple range test.
+        self.lower_skin = np.array([0, 133, 77], dtype=np.uint8)  # Y, Cr, Cb
+        self.upper_skin = np.array([255, 173, 127], dtype=np.uint8)
+
+        # Previous hand positions for smoothing, kept in a fixed-size ring
+        # buffer with a running sum so averaging is O(1) per frame
         self.max_positions = 5
+        self.prev_positions = np.zeros((self.max_positions, 2), dtype=np.int32)
+        self.prev_pos_index = 0
+        self.prev_pos_count = 0
+        self.prev_pos_sum = np.zeros(2, dtype=np.int64)
 
         # Current gesture
         self.current_gesture = "unknown"
@@ -34,23 +44,77 @@ class SimpleHandDetector:
         # Adaptive parameters for better tracking
         self.min_contour_area = 3000  # Minimum area for hand contour
 
-    def process_frame(self, frame, face_mask=None):
+        # Morphology kernels, built once instead of per frame
+        self.kernel3 = np.ones((3, 3), np.uint8)
+        self.kernel5 = np.ones((5, 5), np.uint8)
+
+        # Fraction of the input resolution the mask pipeline runs at
+        self.proc_scale = proc_scale
+
+        # Paint the binary mask into a corner of the visualization frame
+        # (diagnostic only, costs a resize + color conversion per frame).
+        # The inset buffers are allocated on first debug use and reused.
+        self.debug = False
+        self._mask_small = None
+        self._mask_small_bgr = None
+
+        # Temporal cache: when the binary mask barely changes between
+        # frames (stationary hand) the contour/gesture pass is skipped
+        # and the previous result redrawn. Reset every few frames so a
+        # slowly drifting hand can't pin a stale result forever.
+        self._prev_mask = None
+        self._cached_result = None
+        self._stable_frames = 0
+        self.stable_diff_threshold = 2.0
+        self.stable_reset_frames = 30
+
+        # Reusable buffers for the mask pipeline, allocated lazily once the
+        # (downscaled) frame size is known so no stage allocates per frame
+        self.small_buf = None
+        self.ycc_buf = None
+        self.mask_buf_a = None
+        self.mask_buf_b = None
+
+    def _ensure_buffers(self, height, width):
+        """Allocate (or re-allocate) the pipeline buffers for a frame size."""
+        if self.ycc_buf is None or self.ycc_buf.shape[:2] != (height, width):
+            self.small_buf = np.empty((height, width, 3), dtype=np.uint8)
+            self.ycc_buf = np.empty((height, width, 3), dtype=np.uint8)
+            self.mask_buf_a = np.empty((height, width), dtype=np.uint8)
+            self.mask_buf_b = np.empty((height, width), dtype=np.uint8)
+
+    def process_frame(self, frame, face_mask=None, in_place=False):
         """Process a frame to detect a hand and its center.
 
         Args:
             frame: OpenCV frame (BGR format)
             face_mask: Optional mask to exclude face areas (255=include, 0=exclude)
+            in_place: Draw the visualization directly on ``frame`` instead
+                of copying it first. Only safe when the caller owns the
+                frame and won't reuse it as a clean source.
 
         Returns:
             tuple: (hand_center, contour, processed_frame)
         """
-        # Create a visualization frame
-        processed_frame = frame.copy()
+        # Create a visualization frame (a full-frame memcpy, so callers
+        # that hand over ownership of the frame skip it via in_place)
+        processed_frame = frame if in_place else frame.copy()
+
+        # Downscale once; every pipeline stage below runs on the small frame
+        height, width = frame.shape[:2]
+        small_h = int(height * self.proc_scale)
+        small_w = int(width * self.proc_scale)
+        self._ensure_buffers(small_h, small_w)
+        cv2.resize(
+            frame, (small_w, small_h), dst=self.small_buf,
+            interpolation=cv2.INTER_AREA,
+        )
+        small = self.small_buf
 
         # Apply background subtraction if we have a model
         if self.frame_count < self.frames_to_learn:
             # Learning phase - just apply the model but don't use it yet
-            self.bg_subtractor.apply(frame)
+            self.bg_subtractor.apply(small)
             self.frame_count += 1
 
             if self.frame_count == self.frames_to_learn:
@@ -70,71 +134,113 @@ class SimpleHandDetector:
         motion_mask = None
         if self.has_bg_model:
             # Get foreground mask
-            motion_mask = self.bg_subtractor.apply(frame)
+            motion_mask = self.bg_subtractor.apply(small)
             # Clean up the mask
-            motion_mask = cv2.morphologyEx(
-                motion_mask, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8)
-            )
-            motion_mask = cv2.morphologyEx(
-                motion_mask, cv2.MORPH_CLOSE, np.ones((5, 5), np.uint8)
-            )
+            motion_mask = cv2.morphologyEx(motion_mask, cv2.MORPH_OPEN, self.kernel3)
+            motion_mask = cv2.morphologyEx(motion_mask, cv2.MORPH_CLOSE, self.kernel5)
             # Only consider pixels with value 255 (confident foreground)
             motion_mask = cv2.threshold(motion_mask, 200, 255, cv2.THRESH_BINARY)[1]
 
-        # Convert to HSV color space for skin detection
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        # Convert to YCrCb color space for skin detection, reusing the
+        # preallocated buffers (ping-ponging between the two mask buffers)
+        # so none of the pipeline stages allocates a full image
+        cv2.cvtColor(small, cv2.COLOR_BGR2YCrCb, dst=self.ycc_buf)
 
         # Create a binary mask of skin color
-        skin_mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
+        mask = cv2.inRange(
+            self.ycc_buf, self.lower_skin, self.upper_skin, dst=self.mask_buf_a
+        )
 
         # Combine skin detection with motion detection if available
         if motion_mask is not None:
-            mask = cv2.bitwise_and(skin_mask, motion_mask)
-        else:
-            mask = skin_mask
+            mask = cv2.bitwise_and(mask, motion_mask, dst=mask)
 
         # If a face mask is provided, use it to exclude face areas
         if face_mask is not None:
-            # Apply face mask to exclude face areas from skin detection
-            mask = cv2.bitwise_and(mask, face_mask)
+            # Apply face mask to exclude face areas from skin detection,
+            # downscaled to match the working resolution
+            if face_mask.shape[:2] != (small_h, small_w):
+                face_mask = cv2.resize(
+                    face_mask, (small_w, small_h),
+                    interpolation=cv2.INTER_NEAREST,
+                )
+            mask = cv2.bitwise_and(mask, face_mask, dst=mask)
 
         # Apply morphological operations to clean up the mask
-        kernel = np.ones((5, 5), np.uint8)
-        mask = cv2.erode(mask, kernel, iterations=1)
+        mask = cv2.erode(mask, self.kernel5, dst=self.mask_buf_b, iterations=1)
         mask = cv2.dilate(
-            mask, kernel, iterations=3
+            mask, self.kernel5, dst=self.mask_buf_a, iterations=3
         )  # More dilation to connect hand parts
-        mask = cv2.GaussianBlur(mask, (5, 5), 0)
+        mask = cv2.GaussianBlur(mask, (5, 5), 0, dst=self.mask_buf_b)
 
         # Final thresholding to get binary mask
-        mask = cv2.threshold(mask, 60, 255, cv2.THRESH_BINARY)[1]
+        mask = cv2.threshold(mask, 60, 255, cv2.THRESH_BINARY, dst=self.mask_buf_a)[1]
+
+        # Temporal skip: if the mask is nearly identical to the previous
+        # frame's, reuse the cached detection instead of re-running the
+        # contour, moments and gesture passes
+        if self._prev_mask is not None and self._prev_mask.shape == mask.shape:
+            mean_diff = cv2.norm(mask, self._prev_mask, cv2.NORM_L1) / mask.size
+            if (
+                mean_diff < self.stable_diff_threshold
+                and self._cached_result is not None
+                and self._stable_frames < self.stable_reset_frames
+            ):
+                self._stable_frames += 1
+                smooth_center, max_contour = self._cached_result
+                self._draw_detection(processed_frame, smooth_center, max_contour)
+                return smooth_center, max_contour, processed_frame
+        else:
+            self._prev_mask = np.empty_like(mask)
+        np.copyto(self._prev_mask, mask)
+        self._stable_frames = 0
 
         # Add the mask in a small corner for debugging
-        h, w = frame.shape[:2]
-        mask_small = cv2.resize(mask, (w // 4, h // 4))
-        # Add small mask in the bottom right corner
-        processed_frame[h - h // 4 : h, w - w // 4 : w] = cv2.cvtColor(
-            mask_small, cv2.COLOR_GRAY2BGR
+        if self.debug:
+            h, w = height, width
+            inset = (h // 4, w // 4)
+            if self._mask_small is None or self._mask_small.shape != inset:
+                self._mask_small = np.empty(inset, dtype=np.uint8)
+                self._mask_small_bgr = np.empty(inset + (3,), dtype=np.uint8)
+            cv2.resize(mask, (w // 4, h // 4), dst=self._mask_small)
+            cv2.cvtColor(
+                self._mask_small, cv2.COLOR_GRAY2BGR, dst=self._mask_small_bgr
+            )
+            # Add small mask in the bottom right corner
+            processed_frame[h - h // 4 : h, w - w // 4 : w] = self._mask_small_bgr
+
+        # Find contours. Only outer contours matter since we take the single
+        # largest one, and the Teh-Chin approximation keeps the polylines
+        # short for the downstream hull/defect math.
+        contours, _ = cv2.findContours(
+            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_L1
         )
 
-        # Find contours
-        contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-
         # If no contours found
         if not contours:
+            self._cached_result = None
             return None, None, processed_frame
 
-        # Find the largest contour (presumably the hand)
-        valid_contours = [
-            c for c in contours if cv2.contourArea(c) > self.min_contour_area
-        ]
-        if not valid_contours:
+        # Find the largest contour (presumably the hand), computing each
+        # area exactly once. Areas shrink by proc_scale squared, so the
+        # size threshold scales to match.
+        min_area = self.min_contour_area * self.proc_scale * self.proc_scale
+        areas = np.fromiter(
+            (cv2.contourArea(c) for c in contours),
+            dtype=np.float32,
+            count=len(contours),
+        )
+        best = int(areas.argmax())
+        if areas[best] <= min_area:
+            self._cached_result = None
             return None, None, processed_frame
 
-        max_contour = max(valid_contours, key=cv2.contourArea)
+        max_contour = contours[best]
 
-        # Draw the contour on the visualization frame
-        cv2.drawContours(processed_frame, [max_contour], -1, (0, 255, 0), 2)
+        # Scale the winning contour back to full-frame coordinates so all
+        # downstream geometry (center, gesture, drawing) is scale-agnostic
+        if self.proc_scale != 1:
+            max_contour = np.rint(max_contour / self.proc_scale).astype(np.int32)
 
         # Find the center of the hand
         M = cv2.moments(max_contour)
@@ -143,41 +249,42 @@ class SimpleHandDetector:
             cy = int(M["m01"] / M["m00"])
             hand_center = (cx, cy)
 
-            # Apply smoothing
-            self.prev_positions.append(hand_center)
-            if len(self.prev_positions) > self.max_positions:
-                self.prev_positions.pop(0)
+            # Apply smoothing via the ring buffer, updating the running sum
+            # as the oldest entry drops out instead of re-summing the buffer
+            self.prev_pos_sum += hand_center
+            self.prev_pos_sum -= self.prev_positions[self.prev_pos_index]
+            self.prev_positions[self.prev_pos_index] = hand_center
+            self.prev_pos_index = (self.prev_pos_index + 1) % self.max_positions
+            self.prev_pos_count = min(self.prev_pos_count + 1, self.max_positions)
 
-            # Calculate the average position for smoothing
-            avg_x = sum(pos[0] for pos in self.prev_positions) // len(
-                self.prev_positions
-            )
-            avg_y = sum(pos[1] for pos in self.prev_positions) // len(
-                self.prev_positions
-            )
-            smooth_center = (avg_x, avg_y)
-
-            # Draw the hand center
-            cv2.circle(processed_frame, smooth_center, 5, (0, 0, 255), -1)
+            avg_x, avg_y = self.prev_pos_sum // self.prev_pos_count
+            smooth_center = (int(avg_x), int(avg_y))
 
             # Get the current gesture
             self.detect_gesture(max_contour)
 
-            # Draw the gesture text
-            cv2.putText(
-                processed_frame,
-                self.current_gesture,
-                (cx, cy - 20),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                (255, 0, 0),
-                2,
-            )
+            self._cached_result = (smooth_center, max_contour)
+            self._draw_detection(processed_frame, smooth_center, max_contour)
 
             return smooth_center, max_contour, processed_frame
 
+        self._cached_result = None
         return None, None, processed_frame
 
+    def _draw_detection(self, processed_frame, center, contour):
+        """Draw the contour, smoothed center and gesture label on a frame."""
+        cv2.drawContours(processed_frame, [contour], -1, (0, 255, 0), 2)
+        cv2.circle(processed_frame, center, 5, (0, 0, 255), -1)
+        cv2.putText(
+            processed_frame,
+            self.current_gesture,
+            (center[0], center[1] - 20),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.7,
+            (255, 0, 0),
+            2,
+        )
+
     def detect_gesture(self, contour):
         """Detect a simple hand gesture based on contour properties.
 
@@ -207,27 +314,28 @@ class SimpleHandDetector:
             self.current_gesture = "closed_fist"
             return
 
-        # Count fingers using convexity defects
-        finger_count = 0
-        for i in range(defects.shape[0]):
-            s, e, f, d = defects[i, 0]
-            start = tuple(contour[s][0])
-            end = tuple(contour[e][0])
-            far = tuple(contour[f][0])
-
-            # Calculate angle between start, far, and end points
-            a = math.sqrt((end[0] - start[0]) ** 2 + (end[1] - start[1]) ** 2)
-            b = math.sqrt((far[0] - start[0]) ** 2 + (far[1] - start[1]) ** 2)
-            c = math.sqrt((end[0] - far[0]) ** 2 + (end[1] - far[1]) ** 2)
-
-            try:
-                angle = math.acos((b**2 + c**2 - a**2) / (2 * b * c))
-            except:
-                continue
-
-            # If angle is less than 90 degrees, it's likely a finger gap
-            if angle <= math.pi / 2:
-                finger_count += 1
+        # Count fingers using convexity defects, vectorized over all defects
+        # at once (reshape also tolerates both the (N,1,4) and (N,4) defect
+        # layouts returned by different OpenCV versions)
+        defects = defects.reshape(-1, 4)
+        points = contour.reshape(-1, 2).astype(np.float64)
+        start = points[defects[:, 0]]
+        end = points[defects[:, 1]]
+        far = points[defects[:, 2]]
+
+        # Calculate angle between start, far, and end points
+        a = np.sqrt(((end - start) ** 2).sum(axis=1))
+        b = np.sqrt(((far - start) ** 2).sum(axis=1))
+        c = np.sqrt(((end - far) ** 2).sum(axis=1))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_angle = (b**2 + c**2 - a**2) / (2 * b * c)
+
+        # Skip degenerate defects (zero-length sides or out-of-domain cosine)
+        valid = np.isfinite(cos_angle) & (np.abs(cos_angle) <= 1)
+
+        # If angle is less than 90 degrees, it's likely a finger gap
+        finger_count = int((np.arccos(cos_angle[valid]) <= math.pi / 2).sum())
 
         # Determine gesture based on finger count
         if finger_count == 0:
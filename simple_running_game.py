@@ -1,12 +1,52 @@
 import os
-import random
+import queue
 import sys
+import threading
 import time
 
 import cv2
 import numpy as np
 
 
+class CameraReader:
+    """Reads camera frames on a daemon thread, keeping only the latest.
+
+    Decouples the blocking cap.read() from the game loop: the thread
+    continuously overwrites a single slot with the freshest frame and the
+    game grabs it non-blockingly.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.latest = None
+        self.running = True
+        self.first_frame = threading.Event()
+        self.thread = threading.Thread(target=self._reader, daemon=True)
+        self.thread.start()
+
+    def _reader(self):
+        while self.running and self.cap.isOpened():
+            ret, frame = self.cap.read()
+            if not ret:
+                self.running = False
+                break
+            with self.lock:
+                self.latest = frame
+            self.first_frame.set()
+
+    def read(self):
+        """Return (ret, frame) with a copy of the freshest frame."""
+        with self.lock:
+            if self.latest is None:
+                return False, None
+            return True, self.latest.copy()
+
+    def stop(self):
+        self.running = False
+        self.thread.join(timeout=1.0)
+
+
 class SimpleRunningGame:
     def __init__(self):
         # Game window setup
@@ -31,27 +71,78 @@ class SimpleRunningGame:
         self.player_height = 80
         self.player_y = self.height - self.player_height - 20
 
-        # Obstacles
-        self.obstacles = []
+        # Obstacles, stored as structure-of-arrays columns so updates and
+        # culling run as single NumPy operations instead of per-dict loops
+        self.obstacles_x = np.empty(0, dtype=np.int32)
+        self.obstacles_y = np.empty(0, dtype=np.int32)
+        self.obstacles_type = np.empty(0, dtype=np.uint8)  # index into obstacle_types
         self.obstacle_types = ["barrier", "hole"]
         self.obstacle_width = 60
         self.obstacle_height = 60
         self.obstacle_spawn_timer = 0
         self.obstacle_spawn_delay = 60  # frames
 
-        # Coins
-        self.coins = []
+        # Coins, same structure-of-arrays layout
+        self.coins_x = np.empty(0, dtype=np.int32)
+        self.coins_y = np.empty(0, dtype=np.int32)
         self.coin_spawn_timer = 0
         self.coin_spawn_delay = 30  # frames
 
         # Game elements
         self.background = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         self.draw_road()
+        self.window = self.background.copy()
+
+        # Regions of the window that were drawn over last frame and need to
+        # be restored from the background before redrawing (dirty rects)
+        self.dirty_rects = []
+
+        # Spawn randomness drawn from a precomputed batch instead of per-call
+        # random.randint dispatch; the pool is refilled when it wraps
+        self.spawn_pool_size = 4096
+        self.spawn_index = 0
+        self.spawn_lanes = np.random.randint(
+            0, 3, self.spawn_pool_size, dtype=np.uint8
+        )
+        self.spawn_types = np.random.randint(
+            0, 2, self.spawn_pool_size, dtype=np.uint8
+        )
+
+        # Pre-rasterized sprites; draw_game blits these with a clipped slice
+        # assignment instead of re-drawing shapes through the OpenCV API
+        sprite_shape = (self.obstacle_height, self.obstacle_width, 3)
+        self.barrier_sprite = np.full(sprite_shape, (0, 0, 255), dtype=np.uint8)
+        self.hole_sprite = np.zeros(sprite_shape, dtype=np.uint8)
+        self.obstacle_sprites = [self.barrier_sprite, self.hole_sprite]
+        self.player_sprite = np.full(
+            (self.player_height, self.player_width, 3), (0, 255, 0), dtype=np.uint8
+        )
+        self.coin_sprite = np.zeros((30, 30, 3), dtype=np.uint8)
+        cv2.circle(self.coin_sprite, (15, 15), 15, (0, 255, 255), -1)
+        self.coin_mask = self.coin_sprite.any(axis=2)
+
+        # Pre-rendered text masks so cv2.putText's glyph rasterization stays
+        # off the per-frame draw path
+        self.score_label_mask = self.render_text("Score: ", 1, 2)
+        self.digit_masks = [self.render_text(str(d), 1, 2) for d in range(10)]
+        self.game_over_mask = self.render_text("GAME OVER", 2, 3)
 
         # Hand tracking
         self.prev_hand_x = None
         self.movement_threshold = 50
 
+        # Hand detection runs every N frames; the last detected position is
+        # reused in between, so the main loop isn't paying for detection on
+        # every single camera frame.
+        self.detect_every = 3
+        self.frame_index = 0
+
+        # Reusable detection buffers, allocated once the camera frame size
+        # is known (detect_hand_x only runs on the single worker thread)
+        self.roi_buf = None
+        self.gray_buf = None
+        self.thresh_buf = None
+
     def draw_road(self):
         # Draw road
         cv2.rectangle(
@@ -66,29 +157,44 @@ class SimpleRunningGame:
                     self.background, (x - 2, y), (x + 2, y + 20), (255, 255, 255), -1
                 )
 
+    def next_spawn(self):
+        """Take the next (lane, type) pair from the precomputed stream."""
+        lane = int(self.spawn_lanes[self.spawn_index])
+        type_index = int(self.spawn_types[self.spawn_index])
+        self.spawn_index += 1
+        if self.spawn_index == self.spawn_pool_size:
+            # Refill so the stream doesn't repeat
+            self.spawn_lanes = np.random.randint(
+                0, 3, self.spawn_pool_size, dtype=np.uint8
+            )
+            self.spawn_types = np.random.randint(
+                0, 2, self.spawn_pool_size, dtype=np.uint8
+            )
+            self.spawn_index = 0
+        return lane, type_index
+
     def spawn_obstacle(self):
-        lane = random.randint(0, 2)
-        obstacle_type = random.choice(self.obstacle_types)
-        self.obstacles.append(
-            {
-                "x": self.lanes[lane] - self.obstacle_width // 2,
-                "y": -self.obstacle_height,
-                "type": obstacle_type,
-                "lane": lane,
-            }
+        lane, type_index = self.next_spawn()
+        self.obstacles_x = np.append(
+            self.obstacles_x, self.lanes[lane] - self.obstacle_width // 2
         )
+        self.obstacles_y = np.append(self.obstacles_y, -self.obstacle_height)
+        self.obstacles_type = np.append(self.obstacles_type, type_index)
 
     def spawn_coin(self):
-        lane = random.randint(0, 2)
-        self.coins.append({"x": self.lanes[lane] - 15, "y": -30, "lane": lane})
+        lane, _ = self.next_spawn()
+        self.coins_x = np.append(self.coins_x, self.lanes[lane] - 15)
+        self.coins_y = np.append(self.coins_y, -30)
 
     def update_obstacles(self):
-        # Update obstacles
-        for obstacle in self.obstacles[:]:
-            obstacle["y"] += self.speed
-            if obstacle["y"] > self.height:
-                self.obstacles.remove(obstacle)
-                self.score += 1
+        # Move all obstacles and cull the ones past the bottom in one pass
+        self.obstacles_y += self.speed
+        alive = self.obstacles_y <= self.height
+        self.score += int((~alive).sum())
+        if not alive.all():
+            self.obstacles_x = self.obstacles_x[alive]
+            self.obstacles_y = self.obstacles_y[alive]
+            self.obstacles_type = self.obstacles_type[alive]
 
         # Spawn new obstacles
         self.obstacle_spawn_timer += 1
@@ -97,11 +203,12 @@ class SimpleRunningGame:
             self.obstacle_spawn_timer = 0
 
     def update_coins(self):
-        # Update coins
-        for coin in self.coins[:]:
-            coin["y"] += self.speed
-            if coin["y"] > self.height:
-                self.coins.remove(coin)
+        # Move all coins and cull the ones past the bottom in one pass
+        self.coins_y += self.speed
+        alive = self.coins_y <= self.height
+        if not alive.all():
+            self.coins_x = self.coins_x[alive]
+            self.coins_y = self.coins_y[alive]
 
         # Spawn new coins
         self.coin_spawn_timer += 1
@@ -110,122 +217,192 @@ class SimpleRunningGame:
             self.coin_spawn_timer = 0
 
     def check_collisions(self):
-        player_rect = {
-            "x": self.lanes[self.current_lane] - self.player_width // 2,
-            "y": self.player_y,
-            "width": self.player_width,
-            "height": self.player_height,
-        }
-
-        # Check obstacle collisions
-        for obstacle in self.obstacles:
-            if (
-                abs(obstacle["x"] - player_rect["x"]) < self.obstacle_width
-                and abs(obstacle["y"] - player_rect["y"]) < self.obstacle_height
-            ):
-                self.game_over = True
-                return
+        player_x = self.lanes[self.current_lane] - self.player_width // 2
+        player_y = self.player_y
 
-        # Check coin collisions
-        for coin in self.coins[:]:
-            if (
-                abs(coin["x"] - player_rect["x"]) < 30
-                and abs(coin["y"] - player_rect["y"]) < 30
-            ):
-                self.coins.remove(coin)
-                self.score += 5
+        # Check obstacle collisions in one branchless vectorized test
+        hit = (np.abs(self.obstacles_x - player_x) < self.obstacle_width) & (
+            np.abs(self.obstacles_y - player_y) < self.obstacle_height
+        )
+        if hit.any():
+            self.game_over = True
+            return
+
+        # Check coin collisions the same way and compact the survivors
+        collected = (np.abs(self.coins_x - player_x) < 30) & (
+            np.abs(self.coins_y - player_y) < 30
+        )
+        if collected.any():
+            self.score += 5 * int(collected.sum())
+            keep = ~collected
+            self.coins_x = self.coins_x[keep]
+            self.coins_y = self.coins_y[keep]
+
+    def detect_hand_x(self, frame):
+        """Find the hand's x position in a frame (the heavy detection part).
+
+        Returns:
+            int or None: Hand center x, or None if no hand was found.
+        """
+        # Only the middle band of the frame carries the left/right waving
+        # signal; crop it and halve the resolution so every downstream stage
+        # touches ~5x fewer pixels. Only x is used, so the crop is free and
+        # the downscale just needs the centroid scaled back up.
+        height = frame.shape[0]
+        roi = frame[int(0.2 * height) : int(0.8 * height)]
+
+        # Reuse preallocated buffers for the downscale/grayscale/threshold
+        # stages instead of allocating fresh images every detection
+        small_shape = (roi.shape[0] // 2, roi.shape[1] // 2)
+        if self.roi_buf is None or self.roi_buf.shape[:2] != small_shape:
+            self.roi_buf = np.empty(small_shape + (3,), dtype=np.uint8)
+            self.gray_buf = np.empty(small_shape, dtype=np.uint8)
+            self.thresh_buf = np.empty(small_shape, dtype=np.uint8)
+        cv2.resize(
+            roi,
+            (small_shape[1], small_shape[0]),
+            dst=self.roi_buf,
+            interpolation=cv2.INTER_AREA,
+        )
 
-    def process_hand_movement(self, frame):
         # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        cv2.cvtColor(self.roi_buf, cv2.COLOR_BGR2GRAY, dst=self.gray_buf)
 
         # Apply threshold to detect hand
-        _, thresh = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
+        _, thresh = cv2.threshold(
+            self.gray_buf, 127, 255, cv2.THRESH_BINARY, dst=self.thresh_buf
+        )
 
         # Find contours
         contours, _ = cv2.findContours(
             thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
 
-        if contours:
-            # Get the largest contour (assumed to be the hand)
-            largest_contour = max(contours, key=cv2.contourArea)
+        if not contours:
+            return None
 
-            # Get the center of the hand
-            M = cv2.moments(largest_contour)
-            if M["m00"] != 0:
-                hand_x = int(M["m10"] / M["m00"])
+        # Get the largest contour (assumed to be the hand)
+        largest_contour = max(contours, key=cv2.contourArea)
 
-                if self.prev_hand_x is not None:
-                    movement = hand_x - self.prev_hand_x
+        # Get the center of the hand
+        M = cv2.moments(largest_contour)
+        if M["m00"] == 0:
+            return None
 
-                    # Change lane based on movement
-                    if abs(movement) > self.movement_threshold:
-                        if movement > 0 and self.current_lane < 2:  # Move right
-                            self.current_lane += 1
-                        elif movement < 0 and self.current_lane > 0:  # Move left
-                            self.current_lane -= 1
+        # Scale the centroid back to full-frame coordinates
+        return int(M["m10"] / M["m00"]) * 2
 
-                self.prev_hand_x = hand_x
-            else:
-                self.prev_hand_x = None
-        else:
+    def apply_hand_movement(self, hand_x):
+        """Apply a detected hand x position to the lane state."""
+        if hand_x is None:
             self.prev_hand_x = None
+            return
+
+        if self.prev_hand_x is not None:
+            movement = hand_x - self.prev_hand_x
+
+            # Change lane based on movement
+            if abs(movement) > self.movement_threshold:
+                if movement > 0 and self.current_lane < 2:  # Move right
+                    self.current_lane += 1
+                elif movement < 0 and self.current_lane > 0:  # Move left
+                    self.current_lane -= 1
+
+        self.prev_hand_x = hand_x
+
+    def process_hand_movement(self, frame):
+        self.apply_hand_movement(self.detect_hand_x(frame))
+
+    def blit_sprite(self, sprite, x, y, mask=None):
+        # Copy a pre-rasterized sprite into the window, clipping partially
+        # off-screen sprites (e.g. obstacles entering from the top)
+        height, width = sprite.shape[:2]
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(self.width, x + width), min(self.height, y + height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        sprite_view = sprite[y1 - y : y2 - y, x1 - x : x2 - x]
+        if mask is None:
+            self.window[y1:y2, x1:x2] = sprite_view
+            self.mark_dirty(x1, y1, x2, y2)
+        else:
+            mask_view = mask[y1 - y : y2 - y, x1 - x : x2 - x]
+            region = self.window[y1:y2, x1:x2]
+            region[mask_view] = sprite_view[mask_view]
+            self.mark_dirty(x1, y1, x2, y2, mask_view)
+
+    def render_text(self, text, scale, thickness):
+        # Rasterize text once into a grayscale mask that draw_game can blit
+        (width, height), baseline = cv2.getTextSize(
+            text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+        )
+        canvas = np.zeros((height + baseline, width), dtype=np.uint8)
+        cv2.putText(
+            canvas, text, (0, height), cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness
+        )
+        return canvas
+
+    def blit_text(self, mask, x, y, color):
+        # Stamp a pre-rendered text mask onto the window in the given color
+        height, width = mask.shape
+        region = self.window[y : y + height, x : x + width]
+        region[mask[: region.shape[0], : region.shape[1]] > 0] = color
+        self.mark_dirty(x, y, x + width, y + height)
+        return width
+
+    def mark_dirty(self, x1, y1, x2, y2, mask=None):
+        # Clip the rect to the window and remember it for the next restore.
+        # A mask (matching the clipped rect) restricts the restore to the
+        # sprite's actual pixels, e.g. the coin circle rather than its bbox.
+        x1 = max(0, min(x1, self.width))
+        x2 = max(0, min(x2, self.width))
+        y1 = max(0, min(y1, self.height))
+        y2 = max(0, min(y2, self.height))
+        if x1 < x2 and y1 < y2:
+            self.dirty_rects.append((x1, y1, x2, y2, mask))
 
     def draw_game(self):
-        # Draw background
-        self.window = self.background.copy()
+        # Restore only the regions drawn last frame instead of copying the
+        # whole 800x600 background every frame; masked entries restore just
+        # the sprite's own pixels
+        for x1, y1, x2, y2, mask in self.dirty_rects:
+            if mask is None:
+                self.window[y1:y2, x1:x2] = self.background[y1:y2, x1:x2]
+            else:
+                region = self.window[y1:y2, x1:x2]
+                region[mask] = self.background[y1:y2, x1:x2][mask]
+        self.dirty_rects = []
 
         # Draw player
         player_x = self.lanes[self.current_lane] - self.player_width // 2
-        cv2.rectangle(
-            self.window,
-            (player_x, self.player_y),
-            (player_x + self.player_width, self.player_y + self.player_height),
-            (0, 255, 0),
-            -1,
-        )
+        self.blit_sprite(self.player_sprite, player_x, self.player_y)
 
         # Draw obstacles
-        for obstacle in self.obstacles:
-            color = (0, 0, 255) if obstacle["type"] == "barrier" else (0, 0, 0)
-            cv2.rectangle(
-                self.window,
-                (obstacle["x"], obstacle["y"]),
-                (
-                    obstacle["x"] + self.obstacle_width,
-                    obstacle["y"] + self.obstacle_height,
-                ),
-                color,
-                -1,
+        for obstacle_x, obstacle_y, type_index in zip(
+            self.obstacles_x, self.obstacles_y, self.obstacles_type
+        ):
+            self.blit_sprite(
+                self.obstacle_sprites[type_index], int(obstacle_x), int(obstacle_y)
             )
 
         # Draw coins
-        for coin in self.coins:
-            cv2.circle(
-                self.window, (coin["x"] + 15, coin["y"] + 15), 15, (0, 255, 255), -1
+        for coin_x, coin_y in zip(self.coins_x, self.coins_y):
+            self.blit_sprite(
+                self.coin_sprite, int(coin_x), int(coin_y), mask=self.coin_mask
             )
 
-        # Draw score
-        cv2.putText(
-            self.window,
-            f"Score: {self.score}",
-            (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (255, 255, 255),
-            2,
-        )
+        # Draw score from the pre-rendered glyph masks
+        x = 10
+        x += self.blit_text(self.score_label_mask, x, 8, (255, 255, 255))
+        for digit in str(self.score):
+            x += self.blit_text(self.digit_masks[int(digit)], x, 8, (255, 255, 255))
 
         if self.game_over:
-            cv2.putText(
-                self.window,
-                "GAME OVER",
-                (self.width // 2 - 100, self.height // 2),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                2,
+            self.blit_text(
+                self.game_over_mask,
+                self.width // 2 - 100,
+                self.height // 2 - 50,
                 (0, 0, 255),
-                3,
             )
 
     def run(self):
@@ -251,16 +428,67 @@ class SimpleRunningGame:
         print("Move your hand left/right to change lanes")
         print("Press 'q' to quit")
 
-        while cap.isOpened() and not self.game_over:
-            ret, frame = cap.read()
+        # Cap the capture resolution; lane detection only needs a coarse
+        # hand position, so there's no reason to pay for HD frames
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+
+        # Keep the driver from queueing stale frames and read the camera on
+        # a background thread so the game loop never blocks on capture
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        reader = CameraReader(cap)
+        reader.first_frame.wait(timeout=5.0)
+
+        # Hand detection runs on its own worker thread, pipelined with the
+        # game update/draw stage through two small drop-oldest queues
+        frame_queue = queue.Queue(maxsize=2)
+        result_queue = queue.Queue(maxsize=2)
+
+        def detect_worker():
+            while True:
+                work_frame = frame_queue.get()
+                if work_frame is None:
+                    break
+                hand_x = self.detect_hand_x(work_frame)
+                try:
+                    result_queue.put_nowait(hand_x)
+                except queue.Full:
+                    try:
+                        result_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    result_queue.put_nowait(hand_x)
+
+        detector_thread = threading.Thread(target=detect_worker, daemon=True)
+        detector_thread.start()
+
+        while reader.running and not self.game_over:
+            ret, frame = reader.read()
             if not ret:
                 break
 
-            # Flip frame horizontally
-            frame = cv2.flip(frame, 1)
+            # Flip frame horizontally in place (the reader hands us a fresh
+            # copy, so no extra allocation is needed)
+            cv2.flip(frame, 1, dst=frame)
 
-            # Process hand movement
-            self.process_hand_movement(frame)
+            # Feed the detector at reduced cadence, dropping stale frames
+            # rather than stalling the loop
+            if (
+                self.frame_index % self.detect_every == 0
+                or self.prev_hand_x is None
+            ):
+                try:
+                    frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+            self.frame_index += 1
+
+            # Apply whatever detection results have arrived
+            while True:
+                try:
+                    self.apply_hand_movement(result_queue.get_nowait())
+                except queue.Empty:
+                    break
 
             # Update game state
             self.update_obstacles()
@@ -270,15 +498,32 @@ class SimpleRunningGame:
             # Draw game
             self.draw_game()
 
+            # Composite the camera feed as a thumbnail in the bottom-right
+            # corner so a single imshow covers both windows
+            thumb_h, thumb_w = self.height // 4, self.width // 4
+            cam_small = cv2.resize(
+                frame, (thumb_w, thumb_h), interpolation=cv2.INTER_AREA
+            )
+            self.window[self.height - thumb_h :, self.width - thumb_w :] = cam_small
+
             # Show game window
             cv2.imshow("Running Game", self.window)
 
-            # Show camera feed
-            cv2.imshow("Camera", frame)
-
             if cv2.waitKey(1) & 0xFF == ord("q"):
                 break
 
+        # Send the shutdown sentinel to the detector thread
+        try:
+            frame_queue.put_nowait(None)
+        except queue.Full:
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            frame_queue.put_nowait(None)
+        detector_thread.join(timeout=1.0)
+
+        reader.stop()
         cap.release()
         cv2.destroyAllWindows()
 
@@ -6,13 +6,14 @@ This version uses basic OpenCV techniques instead of MediaPipe for hand tracking
 
 import math
 import os
-import random
+import queue
 import sys
-import time
+import threading
 
 import cv2
 import numpy as np
 import pygame
+import pygame.freetype
 
 # Game-specific imports
 try:
@@ -27,10 +28,208 @@ except ImportError:
         sys.exit(1)
 
 
+class CameraThread:
+    """Continuously grabs camera frames on a daemon thread.
+
+    Only the most recent decoded frame is kept, so the game loop never
+    blocks on camera I/O and stale driver-side frames are discarded
+    instead of consumed.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        # Double buffer: the producer decodes into one slot while the
+        # consumer reads the other; publishing a frame is just flipping
+        # the write index, which is a single store and atomic under the
+        # GIL, so no lock is taken on the per-frame path
+        self._bufs = [None, None]
+        self._write_idx = 0
+        self._ready = False
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+
+    def _capture_loop(self):
+        while self._running and self.cap.isOpened():
+            if not self.cap.grab():
+                continue
+            # Decode into the off-buffer, reusing its storage after the
+            # first allocation instead of letting retrieve() allocate a
+            # fresh array per frame
+            idx = self._write_idx
+            ret, frame = self.cap.retrieve(self._bufs[idx])
+            if ret:
+                self._bufs[idx] = frame
+                self._write_idx = 1 - idx
+                self._ready = True
+
+    def latest(self, dst=None):
+        """Return a copy of the freshest frame, or None if none arrived yet.
+
+        When dst is a matching preallocated array the frame is copied into
+        it, so steady-state reads allocate nothing. If the producer laps
+        the consumer mid-copy the frame can tear; for preview/detection
+        frames a single torn image is harmless, so no lock is used.
+        """
+        if not self._ready:
+            return None
+        frame = self._bufs[1 - self._write_idx]
+        if frame is None:
+            return None
+        if dst is not None and dst.shape == frame.shape:
+            np.copyto(dst, frame)
+            return dst
+        return frame.copy()
+
+    def stop(self):
+        self._running = False
+        self._thread.join(timeout=1.0)
+
+
+class HandWorker:
+    """Runs hand detection on a background thread.
+
+    Frames go in through a one-deep queue where a newer frame replaces
+    any stale one still waiting, and the latest (center, gesture,
+    processed_frame) result is published under a lock, so the pygame
+    loop never blocks on OpenCV.
+    """
+
+    def __init__(self, detector):
+        self.detector = detector
+        self._frames = queue.Queue(maxsize=1)
+        self._lock = threading.Lock()
+        self._result = None
+        self._thread = threading.Thread(target=self._work_loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """Queue a frame for detection, discarding any stale pending one."""
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frames.put_nowait(frame)
+            except queue.Full:
+                pass
+
+    def _work_loop(self):
+        while True:
+            frame = self._frames.get()
+            if frame is None:
+                break
+            # The submitted frame is this worker's own copy, so the detector
+            # can draw its visualization straight onto it
+            center, _, processed_frame = self.detector.process_frame(
+                frame, in_place=True
+            )
+            gesture = self.detector.get_gesture()
+            with self._lock:
+                self._result = (center, gesture, processed_frame)
+
+    def result(self):
+        """Return the most recent (center, gesture, processed_frame), or None."""
+        with self._lock:
+            return self._result
+
+    def stop(self):
+        self.submit(None)
+        self._thread.join(timeout=1.0)
+
+
+class SpatialHashGrid:
+    """Uniform spatial hash over fixed-size cells for static AABBs.
+
+    Collision checks only visit objects in the cells overlapped by the
+    query box instead of scanning every object each frame.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell_range(self, x1, y1, x2, y2):
+        cs = self.cell_size
+        return int(x1) // cs, int(y1) // cs, int(x2) // cs, int(y2) // cs
+
+    def insert(self, obj, x1, y1, x2, y2):
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    def remove(self, obj, x1, y1, x2, y2):
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket and obj in bucket:
+                    bucket.remove(obj)
+
+    def query(self, x1, y1, x2, y2):
+        """Return the objects whose cells overlap the query box."""
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        seen = set()
+        result = []
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        result.append(obj)
+        return result
+
+    def clear(self):
+        self.cells.clear()
+
+
+# Module-level binding skips the pygame -> draw -> rect attribute chain on
+# every draw call
+_draw_rect = pygame.draw.rect
+
+# Pre-rasterized circle sprites shared by targets and particles. Blitting a
+# cached surface is a plain SDL composite, versus re-rasterizing the circle
+# in software on every draw call.
+_circle_sprites = {}
+
+
+def _circle_sprite(color, radius):
+    """Return a cached SRCALPHA surface with a filled circle drawn on it."""
+    key = (color, radius)
+    sprite = _circle_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite = sprite.convert_alpha()
+        _circle_sprites[key] = sprite
+    return sprite
+
+
 # Classes needed but missing from removed src folder
 class Character:
     """The player character that moves around the screen."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "color",
+        "velocity_x",
+        "velocity_y",
+        "speed",
+        "jump_strength",
+        "gravity",
+        "on_ground",
+        "health",
+        "score",
+        "rect",
+    )
+
     def __init__(self, x, y, width, height, color=(255, 0, 0)):
         self.x = x
         self.y = y
@@ -45,9 +244,12 @@ class Character:
         self.on_ground = False
         self.health = 100
         self.score = 0
+        # Cached rect, kept in sync by update() so draw and collision code
+        # never rebuild one
+        self.rect = pygame.Rect(x, y, width, height)
 
     def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+        return _draw_rect(screen, self.color, self.rect)
 
     def update(self):
         # Apply gravity
@@ -56,6 +258,7 @@ class Character:
         # Update position
         self.x += self.velocity_x
         self.y += self.velocity_y
+        self.rect.topleft = (int(self.x), int(self.y))
 
     def jump(self):
         if self.on_ground:
@@ -66,28 +269,29 @@ class Character:
 class Obstacle:
     """A game obstacle that can damage the player."""
 
+    __slots__ = ("x", "y", "width", "height", "color", "rect")
+
     def __init__(self, x, y, width, height, color=(255, 0, 0)):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
         self.color = color
+        # Obstacles never move, so the rect is built exactly once
+        self.rect = pygame.Rect(x, y, width, height)
 
     def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+        _draw_rect(screen, self.color, self.rect)
 
     def check_collision(self, character):
-        return (
-            self.x < character.x + character.width
-            and self.x + self.width > character.x
-            and self.y < character.y + character.height
-            and self.y + self.height > character.y
-        )
+        return self.rect.colliderect(character.rect)
 
 
 class Target:
     """A target that the player can collect for points."""
 
+    __slots__ = ("x", "y", "radius", "color", "collected", "value")
+
     def __init__(self, x, y, radius, color=(0, 255, 0)):
         self.x = x
         self.y = y
@@ -98,56 +302,118 @@ class Target:
 
     def draw(self, screen):
         if not self.collected:
-            pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+            sprite = _circle_sprite(self.color, self.radius)
+            return screen.blit(sprite, (self.x - self.radius, self.y - self.radius))
+        return None
 
     def check_collection(self, character):
         if not self.collected:
-            if (
-                self.x > character.x
-                and self.x < character.x + character.width
-                and self.y > character.y
-                and self.y < character.y + character.height
-            ):
+            if character.rect.collidepoint(self.x, self.y):
                 self.collected = True
                 return True
         return False
 
 
 class ParticleSystem:
-    """A simple particle system for visual effects."""
-
-    def __init__(self):
-        self.particles = []
+    """A simple particle system for visual effects.
+
+    Particle state lives in structure-of-arrays NumPy storage, so the
+    per-frame position and lifetime update is a few vectorized
+    operations over contiguous arrays instead of a Python loop over
+    dicts. Colors stay in a parallel list of tuples because they never
+    enter the arithmetic and the sprite cache wants hashable keys.
+
+    The arrays are preallocated to a fixed capacity and the first
+    ``n`` entries are the live particles: emitting fills free slots at
+    the end of the prefix and expiring compacts survivors back down,
+    so the steady state allocates nothing. Bursts past capacity are
+    dropped, which at most trims the largest explosions.
+    """
+
+    __slots__ = (
+        "capacity",
+        "n",
+        "xs",
+        "ys",
+        "dxs",
+        "dys",
+        "sizes",
+        "life",
+        "colors",
+        "_rng",
+    )
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.n = 0
+        self.xs = np.empty(capacity, dtype=np.float32)
+        self.ys = np.empty(capacity, dtype=np.float32)
+        self.dxs = np.empty(capacity, dtype=np.float32)
+        self.dys = np.empty(capacity, dtype=np.float32)
+        self.sizes = np.empty(capacity, dtype=np.int16)
+        self.life = np.empty(capacity, dtype=np.int16)
+        self.colors = [None] * capacity
+        self._rng = np.random.default_rng()
 
     def add_particles(self, x, y, color, count=5):
-        for _ in range(count):
-            particle = {
-                "x": x,
-                "y": y,
-                "dx": random.uniform(-2, 2),
-                "dy": random.uniform(-2, 2),
-                "color": color,
-                "size": random.randint(2, 5),
-                "life": random.randint(10, 30),
-            }
-            self.particles.append(particle)
+        count = min(count, self.capacity - self.n)
+        if count <= 0:
+            return
+        rng = self._rng
+        start, end = self.n, self.n + count
+        self.xs[start:end] = x
+        self.ys[start:end] = y
+        # Radial burst: one vectorized angle/speed draw with ufunc trig
+        # instead of per-particle math calls, and round instead of the
+        # square spread the old independent dx/dy draws produced
+        angles = rng.uniform(0, 2 * np.pi, count)
+        speeds = rng.uniform(0.5, 2, count)
+        self.dxs[start:end] = np.cos(angles) * speeds
+        self.dys[start:end] = np.sin(angles) * speeds
+        self.sizes[start:end] = rng.integers(2, 5, count, endpoint=True)
+        self.life[start:end] = rng.integers(10, 30, count, endpoint=True)
+        self.colors[start:end] = [color] * count
+        self.n = end
 
     def update(self):
-        for particle in self.particles[:]:
-            particle["x"] += particle["dx"]
-            particle["y"] += particle["dy"]
-            particle["life"] -= 1
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
+        n = self.n
+        if n == 0:
+            return
+        self.xs[:n] += self.dxs[:n]
+        self.ys[:n] += self.dys[:n]
+        self.life[:n] -= 1
+
+        # Compact the survivors to the front of the prefix in place; the
+        # freed tail slots are reused by the next add_particles call
+        keep = np.nonzero(self.life[:n] > 0)[0]
+        m = keep.size
+        if m != n:
+            self.xs[:m] = self.xs[keep]
+            self.ys[:m] = self.ys[keep]
+            self.dxs[:m] = self.dxs[keep]
+            self.dys[:m] = self.dys[keep]
+            self.sizes[:m] = self.sizes[keep]
+            self.life[:m] = self.life[keep]
+            colors = self.colors
+            colors[:m] = [colors[i] for i in keep.tolist()]
+            self.n = m
 
     def draw(self, screen):
-        for particle in self.particles:
-            pygame.draw.circle(
-                screen,
-                particle["color"],
-                (int(particle["x"]), int(particle["y"])),
-                particle["size"],
+        n = self.n
+        if n == 0:
+            return []
+        # Assemble the full frame's blits and hand them to a single
+        # Surface.blits call, which loops in C and returns the dirty rects
+        blits = [
+            (_circle_sprite(color, size), (x - size, y - size))
+            for x, y, size, color in zip(
+                self.xs[:n].astype(np.int32).tolist(),
+                self.ys[:n].astype(np.int32).tolist(),
+                self.sizes[:n].tolist(),
+                self.colors[:n],
             )
+        ]
+        return screen.blits(blits)
 
 
 class SimplifiedGame:
@@ -169,7 +435,16 @@ class SimplifiedGame:
         self.clock = pygame.time.Clock()
         self.fps = 60
         self.delta_time = 0
-        self.last_time = time.time()
+
+        # Fixed-step accumulator for game logic (see update())
+        self._fixed_dt = 1 / 60
+        self._accum = 0.0
+
+        # Dirty-rect rendering state: the rects drawn last frame (to be
+        # repaired from the background) and the last state drawn, so
+        # state transitions trigger a full redraw
+        self._prev_dirty = []
+        self._last_drawn_state = None
 
         # Set up webcam
         # Get camera index from environment variable or use default
@@ -190,8 +465,24 @@ class SimplifiedGame:
                 print("Error: Could not open any camera.")
                 sys.exit()
 
-        # Set up hand detector
+        # Ask the driver for MJPEG at 640x480 up front so frames arrive
+        # already at working resolution instead of being decoded full-size
+        # and downscaled afterwards
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+
+        # Keep the driver from queueing stale frames, then read the camera
+        # on a background thread so update() never blocks on capture
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: camera backend ignored CAP_PROP_BUFFERSIZE=1")
+        self.camera = CameraThread(self.cap)
+
+        # Set up hand detector, running on its own worker thread so
+        # detection cost never lands on the pygame update/draw path
         self.hand_detector = SimpleHandDetector()
+        self.hand_worker = HandWorker(self.hand_detector)
 
         # Game state
         self.running = True
@@ -207,6 +498,20 @@ class SimplifiedGame:
         self.obstacles = []
         self.particle_system = ParticleSystem()
 
+        # Spatial hashes so collision checks only look at nearby objects;
+        # brute force is still used while object counts stay small
+        self.target_grid = SpatialHashGrid()
+        self.obstacle_grid = SpatialHashGrid()
+        self.broadphase_threshold = 32
+
+        # Obstacle and target rects in parallel lists so collision checks
+        # can hand the whole batch to Rect.collidelist/collidelistall in
+        # one C-level call. Targets are collected at their center point,
+        # so their rects are 1x1 at (x, y), which makes colliderect agree
+        # exactly with the old collidepoint check.
+        self._obstacle_rects = []
+        self._target_rects = []
+
         # Game timers
         self.target_spawn_timer = 0
         self.obstacle_spawn_timer = 0
@@ -217,10 +522,46 @@ class SimplifiedGame:
         self.hand_position = None
         self.current_gesture = None
 
+        # Reusable frame buffers, allocated lazily once the first frame's
+        # size is known, so hand tracking stops generating a full-frame
+        # numpy allocation (and its GC cost) per processed tick
+        self._frame_buf = None
+        self._flipped_buf = None
+
+        # Camera preview picture-in-picture, rendered into the main pygame
+        # window instead of a second HighGUI window
+        self._pip_surface = None
+        self._pip_small = None
+        self._pip_rgb = None
+
+        # Hot-path constants: the last applied worker result (so unchanged
+        # results are not reprocessed) and the preview overlay text
+        self._last_result = None
+        self._instruction_text = (
+            "Wave hand to start - Use hand gestures to control character"
+        )
+
+        # Hand detection runs at ~20 Hz rather than once per 60 FPS tick;
+        # the camera thread keeps draining the driver in between and
+        # skipped ticks reuse the last detected center/gesture
+        self.hand_tick = 0
+        self.hand_every = max(1, self.fps // 20)
+
+        # Hand-to-screen scale factors, cached per camera frame shape
+        self.hand_scale = None
+
         # Set up fonts
-        self.font_large = pygame.font.SysFont(None, 72)
-        self.font_medium = pygame.font.SysFont(None, 48)
-        self.font_small = pygame.font.SysFont(None, 32)
+        # pygame.freetype renders short strings noticeably faster than
+        # the SDL_ttf-backed pygame.font; sizes are scaled to keep the
+        # rendered glyph height close to the old SysFont sizes
+        pygame.freetype.init()
+        self.font_large = pygame.freetype.SysFont(None, 54)
+        self.font_medium = pygame.freetype.SysFont(None, 36)
+        self.font_small = pygame.freetype.SysFont(None, 24)
+
+        # Cache of rendered text surfaces keyed by (font, text, color);
+        # font rasterization only happens when a string first appears
+        self.text_cache = {}
 
         # Set up colors
         self.BLACK = (0, 0, 0)
@@ -230,106 +571,184 @@ class SimplifiedGame:
         self.BLUE = (0, 0, 255)
         self.YELLOW = (255, 255, 0)
 
+        # Target types with different values; rarer types are worth more
+        self.target_types = [
+            {"type": "standard", "value": 1, "color": self.GREEN},
+            {"type": "bonus", "value": 3, "color": self.YELLOW},
+            {"type": "special", "value": 5, "color": self.BLUE},
+        ]
+        self.target_weights = (0.7, 0.2, 0.1)
+
+        # Batched random number source for spawning; one vectorized draw
+        # replaces a handful of Python-level random calls per object
+        self._rng = np.random.default_rng()
+
         # Initial level setup
         self.setup_level(self.level)
 
+    def render_text(self, font, text, color):
+        """Render text through the cache so unchanged strings reuse their surface."""
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # convert_alpha stores the surface in the display's pixel
+            # format so repeat blits skip per-pixel conversion
+            surface, _ = font.render(text, color)
+            surface = surface.convert_alpha()
+            self.text_cache[key] = surface
+        return surface
+
     def setup_level(self, level):
         """Set up a new level."""
         self.level = level
         self.targets = []
         self.obstacles = []
+        self._obstacle_rects = []
+        self._target_rects = []
+        self.target_grid.clear()
+        self.obstacle_grid.clear()
+
+        # Static background for dirty-rect rendering: black fill plus the
+        # level's obstacles, which never move once spawned. spawn_obstacle
+        # draws onto it and flags a full redraw.
+        self._bg_surf = pygame.Surface((self.width, self.height)).convert()
+        self._bg_surf.fill(self.BLACK)
+        self._bg_dirty = True
 
         # Adjust difficulty based on level
         self.target_spawn_delay = max(0.5, 1.5 - (level - 1) * 0.1)
         self.obstacle_spawn_delay = max(2.0, 5.0 - (level - 1) * 0.3)
 
-        # Add initial targets
-        for _ in range(5):
-            self.spawn_target()
-
-        # Add obstacles based on level
+        # Lay the initial objects out on distinct jittered cells of a
+        # coarse grid so targets never spawn inside obstacles and
+        # obstacles never overlap each other
         num_obstacles = min(level, 8)
-        for _ in range(num_obstacles):
-            self.spawn_obstacle()
+        xs, ys = self._spawn_cells(5 + num_obstacles)
+        self.spawn_target(count=5, centers=(xs[:5], ys[:5]))
+        self.spawn_obstacle(count=num_obstacles, centers=(xs[5:], ys[5:]))
 
         # Reset timers
         self.target_spawn_timer = 0
         self.obstacle_spawn_timer = 0
         self.time_remaining = max(30, 60 - (level - 1) * 5)  # Decrease time per level
 
-    def spawn_target(self):
-        """Create a new target at a random position."""
-        # Generate random position
-        x = random.randint(50, self.width - 50)
-        y = random.randint(50, self.height - 50)
-
-        # Target types with different values
-        target_types = [
-            {"type": "standard", "value": 1, "color": self.GREEN},
-            {"type": "bonus", "value": 3, "color": self.YELLOW},
-            {"type": "special", "value": 5, "color": self.BLUE},
-        ]
-
-        # Select a random target type
-        target_info = random.choice(target_types)
+    def _spawn_cells(self, count):
+        """Pick distinct jittered cells of a coarse grid as spawn centers.
+
+        A shuffled cell permutation guarantees spacing without a
+        rejection-sampling loop, and all the randomness for the batch
+        comes from two vectorized draws.
+        """
+        cell = 100
+        margin = 50
+        cols = (self.width - 2 * margin) // cell
+        rows = (self.height - 2 * margin) // cell
+        picks = self._rng.permutation(cols * rows)[:count]
+        jitter = self._rng.integers(-20, 20, size=(2, count), endpoint=True)
+        xs = margin + (picks % cols) * cell + cell // 2 + jitter[0]
+        ys = margin + (picks // cols) * cell + cell // 2 + jitter[1]
+        return xs, ys
+
+    def spawn_target(self, count=1, centers=None):
+        """Create new targets at random positions.
+
+        Positions and types for the whole batch come from single
+        vectorized generator draws; centers, when given, places the
+        targets on precomputed spawn cells instead.
+        """
+        if centers is not None:
+            xs, ys = centers
+        else:
+            xs = self._rng.integers(50, self.width - 50, size=count, endpoint=True)
+            ys = self._rng.integers(50, self.height - 50, size=count, endpoint=True)
+        kinds = self._rng.choice(
+            len(self.target_types), size=count, p=self.target_weights
+        )
 
-        # Create target
-        target = Target(x, y, 15, target_info["color"])
-        target.value = target_info["value"]  # Add value attribute to the Target
-        self.targets.append(target)
+        for x, y, kind in zip(xs, ys, kinds):
+            x, y = int(x), int(y)
+            target_info = self.target_types[kind]
+            target = Target(x, y, 15, target_info["color"])
+            target.value = target_info["value"]  # Add value attribute to the Target
+            self.targets.append(target)
+            self._target_rects.append(pygame.Rect(x, y, 1, 1))
+            self.target_grid.insert(
+                target, x - target.radius, y - target.radius,
+                x + target.radius, y + target.radius,
+            )
 
-    def spawn_obstacle(self):
-        """Spawn a new obstacle at a random position."""
+    def spawn_obstacle(self, count=1, centers=None):
+        """Spawn new obstacles at random positions, batched like spawn_target."""
         margin = 100
 
-        # Randomize size based on level
-        width = random.randint(30, 50 + self.level * 5)
-        height = random.randint(30, 50 + self.level * 5)
-
-        # Randomize position
-        x = random.randint(margin, self.width - width - margin)
-        y = random.randint(margin, self.height - height - margin)
-
-        # Create obstacle
-        self.obstacles.append(Obstacle(x, y, width, height, self.RED))
+        # Randomize size based on level; the position bounds depend on the
+        # sizes, which integers() handles via array-valued highs
+        widths = self._rng.integers(30, 50 + self.level * 5, size=count, endpoint=True)
+        heights = self._rng.integers(30, 50 + self.level * 5, size=count, endpoint=True)
+        if centers is not None:
+            cx, cy = centers
+            xs = np.clip(cx - widths // 2, 0, self.width - widths)
+            ys = np.clip(cy - heights // 2, 0, self.height - heights)
+        else:
+            xs = self._rng.integers(margin, self.width - widths - margin, endpoint=True)
+            ys = self._rng.integers(margin, self.height - heights - margin, endpoint=True)
+
+        for x, y, width, height in zip(xs, ys, widths, heights):
+            x, y = int(x), int(y)
+            obstacle = Obstacle(x, y, int(width), int(height), self.RED)
+            self.obstacles.append(obstacle)
+            self._obstacle_rects.append(obstacle.rect)
+            self.obstacle_grid.insert(obstacle, x, y, x + width, y + height)
+            obstacle.draw(self._bg_surf)
+            self._bg_dirty = True
 
     def process_hand_tracking(self):
-        """Process webcam input and track hands using simple OpenCV methods."""
-        ret, frame = self.cap.read()
-        if not ret:
-            print("ERROR: Failed to read frame from camera")
+        """Feed the newest camera frame to the detection worker and apply its result."""
+        frame = self.camera.latest(self._frame_buf)
+        if frame is not None:
+            self._frame_buf = frame
+
+            # Flip the frame horizontally for more intuitive mirroring,
+            # writing into the reusable destination buffer. The capture
+            # device is configured for 640x480, so no resize is needed.
+            if self._flipped_buf is None or self._flipped_buf.shape != frame.shape:
+                self._flipped_buf = np.empty_like(frame)
+            cv2.flip(frame, 1, dst=self._flipped_buf)
+
+            # The worker gets its own copy so the flip buffer can be
+            # reused while detection is still running
+            self.hand_worker.submit(self._flipped_buf.copy())
+
+        # Apply the freshest detection result; skipped ticks and frames
+        # still in flight reuse the previous center/gesture. A result
+        # already applied last tick is skipped outright so the overlay
+        # text, preview downscale, and surface rebuild only run when a
+        # new detection actually arrived.
+        result = self.hand_worker.result()
+        if result is None or result is self._last_result:
             return
+        self._last_result = result
+        center, gesture, processed_frame = result
 
-        # Flip the frame horizontally for more intuitive mirroring
-        frame = cv2.flip(frame, 1)
-
-        # Resize frame to be more manageable
-        frame_height, frame_width = frame.shape[:2]
-        target_width = 640  # Target display width
-        if frame_width > target_width:
-            scale = target_width / frame_width
-            frame = cv2.resize(
-                frame, (int(frame_width * scale), int(frame_height * scale))
-            )
-
-        # Process frame with simplified hand detector
-        center, contour, processed_frame = self.hand_detector.process_frame(frame)
-
-        # Get current gesture
-        self.current_gesture = self.hand_detector.get_gesture()
+        self.current_gesture = gesture
 
         # Get hand position
         self.hand_position = center
 
         # Update character based on hand tracking
         if self.hand_position:
-            # Map hand coordinates to screen coordinates
-            screen_x = int(
-                self.hand_position[0] * self.width / processed_frame.shape[1]
-            )
-            screen_y = int(
-                self.hand_position[1] * self.height / processed_frame.shape[0]
-            )
+            # Map hand coordinates to screen coordinates with scale factors
+            # cached per frame shape, so the divisions happen once per
+            # resolution rather than per frame
+            shape = processed_frame.shape[:2]
+            if self.hand_scale is None or self.hand_scale[0] != shape:
+                self.hand_scale = (
+                    shape,
+                    self.width / shape[1],
+                    self.height / shape[0],
+                )
+            screen_x = int(self.hand_position[0] * self.hand_scale[1])
+            screen_y = int(self.hand_position[1] * self.hand_scale[2])
 
             # Update character target position
             self.character.x = screen_x
@@ -342,10 +761,9 @@ class SimplifiedGame:
             self.character.color = self.RED
 
         # Add user instructions to the frame
-        instruction = "Wave hand to start - Use hand gestures to control character"
         cv2.putText(
             processed_frame,
-            instruction,
+            self._instruction_text,
             (10, 30),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.7,
@@ -365,35 +783,63 @@ class SimplifiedGame:
                 2,
             )
 
-        # Make window appear in the foreground
-        cv2.namedWindow("Hand Tracking", cv2.WINDOW_NORMAL)
-        cv2.imshow("Hand Tracking", processed_frame)
-        cv2.moveWindow("Hand Tracking", 50, 50)
+        # Publish the preview as a pygame surface instead of a separate
+        # HighGUI window; draw() blits it as a corner picture-in-picture.
+        # The quarter-size resize and BGR->RGB conversion reuse buffers.
+        h, w = processed_frame.shape[:2]
+        pip_w, pip_h = w // 4, h // 4
+        if self._pip_rgb is None or self._pip_rgb.shape[:2] != (pip_h, pip_w):
+            self._pip_small = np.empty((pip_h, pip_w, 3), dtype=np.uint8)
+            self._pip_rgb = np.empty((pip_h, pip_w, 3), dtype=np.uint8)
+        # INTER_AREA is OpenCV's specialized (and alias-free) downscale path
+        cv2.resize(
+            processed_frame,
+            (pip_w, pip_h),
+            dst=self._pip_small,
+            interpolation=cv2.INTER_AREA,
+        )
+        cv2.cvtColor(self._pip_small, cv2.COLOR_BGR2RGB, dst=self._pip_rgb)
+        self._pip_surface = pygame.image.frombuffer(
+            self._pip_rgb.tobytes(), (pip_w, pip_h), "RGB"
+        ).convert()
 
     def update(self):
         """Update game state."""
-        # Calculate delta time
-        current_time = time.time()
-        self.delta_time = current_time - self.last_time
-        self.last_time = current_time
-
-        # Process hand tracking
-        self.process_hand_tracking()
-
+        # Cap the frame rate and take the elapsed time straight from the
+        # clock, so delta_time stays aligned with the cap instead of being
+        # measured by a separate time.time() pair
+        self.delta_time = self.clock.tick(self.fps) * 0.001
+
+        # Process hand tracking at reduced cadence
+        if self.hand_tick % self.hand_every == 0:
+            self.process_hand_tracking()
+        self.hand_tick += 1
+
+        # Game logic advances in fixed steps so physics and spawn timers
+        # behave the same regardless of render frame rate; a camera stall
+        # produces several catch-up steps instead of one huge delta. The
+        # accumulator is capped so a long stall cannot spiral.
+        self._accum = min(self._accum + self.delta_time, 0.25)
+        while self._accum >= self._fixed_dt:
+            self._update_fixed(self._fixed_dt)
+            self._accum -= self._fixed_dt
+
+    def _update_fixed(self, dt):
+        """Advance the game logic by one fixed timestep."""
         if self.game_state == "playing":
             # Update timers
-            self.time_remaining -= self.delta_time
+            self.time_remaining -= dt
             if self.time_remaining <= 0:
                 self.game_over()
 
             # Spawn targets
-            self.target_spawn_timer += self.delta_time
+            self.target_spawn_timer += dt
             if self.target_spawn_timer >= self.target_spawn_delay:
                 self.spawn_target()
                 self.target_spawn_timer = 0
 
             # Spawn obstacles
-            self.obstacle_spawn_timer += self.delta_time
+            self.obstacle_spawn_timer += dt
             if self.obstacle_spawn_timer >= self.obstacle_spawn_delay:
                 self.spawn_obstacle()
                 self.obstacle_spawn_timer = 0
@@ -401,19 +847,57 @@ class SimplifiedGame:
             # Update character
             self.character.update()
 
-            # Update targets
-            for target in self.targets:
-                if target.check_collection(self.character):
-                    target.collected = True
-                    self.score += target.value
-                    self.targets.remove(target)
-
-            # Update obstacles
-            for obstacle in self.obstacles:
-                if obstacle.check_collision(self.character):
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.game_over()
+            # Update targets: collidelistall tests the character against
+            # every target point rect in a single C call; once enough
+            # targets accumulate, the grid narrows the scan first
+            character = self.character
+            if len(self.targets) >= self.broadphase_threshold:
+                candidates = self.target_grid.query(
+                    character.x, character.y,
+                    character.x + character.width,
+                    character.y + character.height,
+                )
+                hits = [
+                    self.targets.index(t)
+                    for t in candidates
+                    if character.rect.collidepoint(t.x, t.y)
+                ]
+            else:
+                hits = character.rect.collidelistall(self._target_rects)
+            for i in hits:
+                target = self.targets[i]
+                target.collected = True
+                self.score += target.value
+                self.target_grid.remove(
+                    target,
+                    target.x - target.radius, target.y - target.radius,
+                    target.x + target.radius, target.y + target.radius,
+                )
+            if hits:
+                # Single compaction pass over both parallel lists instead
+                # of O(N) list.remove per collected target
+                keep = [
+                    i for i, t in enumerate(self.targets) if not t.collected
+                ]
+                self.targets = [self.targets[i] for i in keep]
+                self._target_rects = [self._target_rects[i] for i in keep]
+
+            # Obstacles damage the player at most once per frame;
+            # collidelist scans the prebuilt rect list in C and stops at
+            # the first hit
+            if len(self.obstacles) >= self.broadphase_threshold:
+                obstacle_candidates = self.obstacle_grid.query(
+                    character.x, character.y,
+                    character.x + character.width,
+                    character.y + character.height,
+                )
+                rects = [obstacle.rect for obstacle in obstacle_candidates]
+            else:
+                rects = self._obstacle_rects
+            if character.rect.collidelist(rects) != -1:
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.game_over()
 
             # Update particles
             self.particle_system.update()
@@ -433,23 +917,40 @@ class SimplifiedGame:
 
     def draw(self):
         """Draw the game state to the screen."""
-        # Fill background
-        self.screen.fill(self.BLACK)
+        full_redraw = self._bg_dirty or self.game_state != self._last_drawn_state
+        self._last_drawn_state = self.game_state
+
+        if self.game_state == "playing":
+            self.draw_playing_screen(full_redraw)
+            self._bg_dirty = False
+            return
 
+        # Title and game-over screens are static text over black; a full
+        # redraw there is cheap since every surface comes from the cache
+        self.screen.fill(self.BLACK)
         if self.game_state == "title":
             self.draw_title_screen()
-        elif self.game_state == "playing":
-            self.draw_playing_screen()
         elif self.game_state == "game_over":
             self.draw_game_over_screen()
-
-        # Update display
+        self._blit_pip()
         pygame.display.flip()
 
+    def _blit_pip(self):
+        """Blit the camera preview bottom-right; returns its rect or None."""
+        if self._pip_surface is None:
+            return None
+        return self.screen.blit(
+            self._pip_surface,
+            (
+                self.width - self._pip_surface.get_width() - 10,
+                self.height - self._pip_surface.get_height() - 10,
+            ),
+        )
+
     def draw_title_screen(self):
         """Draw the title screen."""
         # Draw title
-        title_text = self.font_large.render("Hand Motion Game", True, self.WHITE)
+        title_text = self.render_text(self.font_large, "Hand Motion Game", self.WHITE)
         self.screen.blit(
             title_text,
             (
@@ -468,12 +969,12 @@ class SimplifiedGame:
 
         y_offset = self.height // 2
         for instruction in instructions:
-            text = self.font_small.render(instruction, True, self.WHITE)
+            text = self.render_text(self.font_small, instruction, self.WHITE)
             self.screen.blit(text, (self.width // 2 - text.get_width() // 2, y_offset))
             y_offset += 40
 
         # Draw "Start Game" text
-        start_text = self.font_medium.render("Wave to Start", True, self.YELLOW)
+        start_text = self.render_text(self.font_medium, "Wave to Start", self.YELLOW)
         self.screen.blit(
             start_text,
             (self.width // 2 - start_text.get_width() // 2, self.height * 3 // 4),
@@ -483,58 +984,84 @@ class SimplifiedGame:
         if self.current_gesture in ["open_palm", "victory"]:
             self.game_state = "playing"
 
-    def draw_playing_screen(self):
-        """Draw the main gameplay screen."""
-        # Draw obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+    def draw_playing_screen(self, full_redraw=True):
+        """Draw the gameplay screen with dirty-rect updates.
+
+        Obstacles are pre-drawn on the static background; each frame only
+        the regions under last frame's dynamic objects are repaired from
+        it, the dynamic objects are redrawn, and display.update pushes
+        just those rects instead of the whole window.
+        """
+        if full_redraw:
+            self.screen.blit(self._bg_surf, (0, 0))
+            repaired = [self.screen.get_rect()]
+        else:
+            for rect in self._prev_dirty:
+                self.screen.blit(self._bg_surf, rect, rect)
+            repaired = self._prev_dirty
+
+        dirty = []
 
         # Draw targets
         for target in self.targets:
-            target.draw(self.screen)
+            rect = target.draw(self.screen)
+            if rect is not None:
+                dirty.append(rect)
 
         # Draw particles
-        self.particle_system.draw(self.screen)
+        dirty.extend(self.particle_system.draw(self.screen))
 
         # Draw character
-        self.character.draw(self.screen)
+        dirty.append(self.character.draw(self.screen))
+
+        # Draw UI elements and camera preview
+        dirty.extend(self.draw_ui())
+        pip_rect = self._blit_pip()
+        if pip_rect is not None:
+            dirty.append(pip_rect)
 
-        # Draw UI elements
-        self.draw_ui()
+        pygame.display.update(repaired + dirty)
+        self._prev_dirty = dirty
 
     def draw_ui(self):
-        """Draw UI elements for the playing state."""
+        """Draw UI elements for the playing state; returns their rects."""
+        rects = []
+
         # Draw score
-        score_text = self.font_small.render(f"Score: {self.score}", True, self.WHITE)
-        self.screen.blit(score_text, (20, 20))
+        score_text = self.render_text(self.font_small, f"Score: {self.score}", self.WHITE)
+        rects.append(self.screen.blit(score_text, (20, 20)))
 
         # Draw level
-        level_text = self.font_small.render(f"Level: {self.level}", True, self.WHITE)
-        self.screen.blit(level_text, (20, 60))
+        level_text = self.render_text(self.font_small, f"Level: {self.level}", self.WHITE)
+        rects.append(self.screen.blit(level_text, (20, 60)))
 
         # Draw lives
-        lives_text = self.font_small.render(f"Lives: {self.lives}", True, self.WHITE)
-        self.screen.blit(lives_text, (20, 100))
+        lives_text = self.render_text(self.font_small, f"Lives: {self.lives}", self.WHITE)
+        rects.append(self.screen.blit(lives_text, (20, 100)))
 
         # Draw time remaining
-        time_text = self.font_small.render(
-            f"Time: {int(self.time_remaining)}", True, self.WHITE
+        time_text = self.render_text(
+            self.font_small, f"Time: {int(self.time_remaining)}", self.WHITE
         )
-        self.screen.blit(time_text, (20, 140))
+        rects.append(self.screen.blit(time_text, (20, 140)))
 
         # Draw current gesture
         if self.current_gesture:
-            gesture_text = self.font_small.render(
-                f"Gesture: {self.current_gesture}", True, self.WHITE
+            gesture_text = self.render_text(
+                self.font_small, f"Gesture: {self.current_gesture}", self.WHITE
             )
-            self.screen.blit(
-                gesture_text, (self.width - gesture_text.get_width() - 20, 20)
+            rects.append(
+                self.screen.blit(
+                    gesture_text, (self.width - gesture_text.get_width() - 20, 20)
+                )
             )
 
+        return rects
+
     def draw_game_over_screen(self):
         """Draw the game over screen."""
         # Draw game over text
-        game_over_text = self.font_large.render("Game Over", True, self.RED)
+        game_over_text = self.render_text(self.font_large, "Game Over", self.RED)
         self.screen.blit(
             game_over_text,
             (
@@ -544,8 +1071,8 @@ class SimplifiedGame:
         )
 
         # Draw final score
-        score_text = self.font_medium.render(
-            f"Final Score: {self.score}", True, self.WHITE
+        score_text = self.render_text(
+            self.font_medium, f"Final Score: {self.score}", self.WHITE
         )
         self.screen.blit(
             score_text,
@@ -556,8 +1083,8 @@ class SimplifiedGame:
         )
 
         # Draw level reached
-        level_text = self.font_medium.render(
-            f"Level Reached: {self.level}", True, self.WHITE
+        level_text = self.render_text(
+            self.font_medium, f"Level Reached: {self.level}", self.WHITE
         )
         self.screen.blit(
             level_text,
@@ -568,7 +1095,7 @@ class SimplifiedGame:
         )
 
         # Draw restart instructions
-        restart_text = self.font_medium.render("Wave to Restart", True, self.YELLOW)
+        restart_text = self.render_text(self.font_medium, "Wave to Restart", self.YELLOW)
         self.screen.blit(
             restart_text,
             (self.width // 2 - restart_text.get_width() // 2, self.height * 3 // 4),
@@ -612,13 +1139,11 @@ class SimplifiedGame:
                 # Draw everything
                 self.draw()
 
-                # Cap the frame rate
-                self.clock.tick(self.fps)
-
         finally:
             # Clean up resources
+            self.hand_worker.stop()
+            self.camera.stop()
             self.cap.release()
-            cv2.destroyAllWindows()
             pygame.quit()
 
 
@@ -630,17 +1155,25 @@ def main():
     print("This version uses basic OpenCV for hand tracking instead of MediaPipe.")
     print("Starting game...")
 
-    try:
-        # Install required packages
-        import pip
-
-        for package in ["opencv-python", "numpy", "pygame"]:
-            try:
-                __import__(package.replace("-", "_"))
-            except ImportError:
-                print(f"Installing {package}...")
-                pip.main(["install", package])
+    # Fail fast on missing dependencies instead of importing pip and
+    # installing at launch. find_spec only queries the module finders, so
+    # the check stays metadata-only rather than importing anything.
+    import importlib.util
+
+    missing = [
+        package
+        for package, module in [
+            ("opencv-python", "cv2"),
+            ("numpy", "numpy"),
+            ("pygame", "pygame"),
+        ]
+        if importlib.util.find_spec(module) is None
+    ]
+    if missing:
+        print(f"Missing dependencies. Run: pip install {' '.join(missing)}")
+        return 1
 
+    try:
         game = SimplifiedGame()
         game.run()
     except Exception as e: